@@ -182,7 +182,14 @@ class DynamicCalculatorContext:
 
     def __init__(self, request):
         self.request = request
-        self.operation = getattr(request, "json_body", {}).get("operation", "simple")
+        # json_body raises on empty or invalid bodies rather than returning None
+        try:
+            body = request.json_body
+        except ValueError:
+            body = {}
+        self.operation = (
+            body.get("operation", "simple") if isinstance(body, dict) else "simple"
+        )
 
     def __acl__(self):
         acl = [
@@ -25,7 +25,7 @@ Registering tools:
 """
 
 import logging
-from typing import Any, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from pyramid.config import Configurator
 from pyramid.settings import asbool
@@ -37,7 +37,7 @@ from pyramid_mcp.core import (
     MCPSecurityPredicate,
     PyramidMCP,
 )
-from pyramid_mcp.decorators import tool
+from pyramid_mcp.decorators import add_mcp_tool, tool
 from pyramid_mcp.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -85,6 +85,15 @@ def includeme(config: Configurator) -> None:
         config.registry.settings.update({
             'mcp.enable': 'false'
         })
+
+        # Register tools explicitly instead of scanning for them; like scanned
+        # tools, they are listed through route discovery
+        config = Configurator(settings={
+            'mcp.scan': 'false',
+            'mcp.route_discovery.enabled': 'true',
+        })
+        config.include('pyramid_mcp')
+        config.add_mcp_tool(calculate)
     """
     settings = cast(Any, config.registry).settings
 
@@ -94,6 +103,9 @@ def includeme(config: Configurator) -> None:
     # Include cornice for tool decorator support
     config.include("cornice")
 
+    # Add a directive to register @tool functions without scanning
+    config.add_directive("add_mcp_tool", add_mcp_tool)
+
     # Always register view predicates (they're useful even when MCP is disabled)
     # Register the MCP description view predicate
     config.add_view_predicate("mcp_description", MCPDescriptionPredicate)
@@ -147,42 +159,6 @@ def includeme(config: Configurator) -> None:
 # The standalone tool function is imported at the top
 
 
-def _extract_mcp_config_from_settings(settings: dict) -> MCPConfiguration:
-    """Extract MCP configuration from Pyramid settings."""
-    return MCPConfiguration(
-        server_name=settings.get("mcp.server_name", "pyramid-mcp"),
-        server_version=settings.get("mcp.server_version", "1.0.0"),
-        mount_path=settings.get("mcp.mount_path", "/mcp"),
-        include_patterns=_parse_list_setting(settings.get("mcp.include_patterns")),
-        exclude_patterns=_parse_list_setting(settings.get("mcp.exclude_patterns")),
-        enable_sse=asbool(settings.get("mcp.enable_sse", "true")),
-        enable_http=asbool(settings.get("mcp.enable_http", "true")),
-        # Main enable/disable switch
-        enable=asbool(settings.get("mcp.enable", "true")),
-        # Route discovery settings
-        route_discovery_enabled=asbool(
-            settings.get("mcp.route_discovery.enabled", "false")
-        ),
-        route_discovery_include_patterns=_parse_list_setting(
-            settings.get("mcp.route_discovery.include_patterns")
-        ),
-        route_discovery_exclude_patterns=_parse_list_setting(
-            settings.get("mcp.route_discovery.exclude_patterns")
-        ),
-        # Security parameter settings
-        security_parameter=settings.get("mcp.security_parameter", "mcp_security"),
-        add_security_predicate=asbool(
-            settings.get("mcp.add_security_predicate", "true")
-        ),
-        # Authentication parameter exposure settings
-        expose_auth_as_params=asbool(settings.get("mcp.expose_auth_as_params", "true")),
-        # Tool filtering settings
-        filter_forbidden_tools=asbool(
-            settings.get("mcp.filter_forbidden_tools", "true")
-        ),
-    )
-
-
 def _parse_list_setting(value: Any) -> Optional[List[str]]:
     """Parse a list setting from string format."""
     if not value:
@@ -192,6 +168,57 @@ def _parse_list_setting(value: Any) -> Optional[List[str]]:
     return list(value) if value else None
 
 
+def _as_is(value: Any) -> Any:
+    """Return a setting value unchanged."""
+    return value
+
+
+# Pyramid setting name -> (MCPConfiguration attribute, value parser).
+# Settings missing from the registry fall back to the MCPConfiguration defaults.
+_SETTINGS_MAP: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "mcp.server_name": ("server_name", _as_is),
+    "mcp.server_version": ("server_version", _as_is),
+    "mcp.mount_path": ("mount_path", _as_is),
+    "mcp.include_patterns": ("include_patterns", _parse_list_setting),
+    "mcp.exclude_patterns": ("exclude_patterns", _parse_list_setting),
+    "mcp.enable_sse": ("enable_sse", asbool),
+    "mcp.enable_http": ("enable_http", asbool),
+    # Main enable/disable switch
+    "mcp.enable": ("enable", asbool),
+    # Route discovery settings
+    "mcp.route_discovery.enabled": ("route_discovery_enabled", asbool),
+    "mcp.route_discovery.include_patterns": (
+        "route_discovery_include_patterns",
+        _parse_list_setting,
+    ),
+    "mcp.route_discovery.exclude_patterns": (
+        "route_discovery_exclude_patterns",
+        _parse_list_setting,
+    ),
+    # Security parameter settings
+    "mcp.security_parameter": ("security_parameter", _as_is),
+    "mcp.add_security_predicate": ("add_security_predicate", asbool),
+    # Authentication parameter exposure settings
+    "mcp.expose_auth_as_params": ("expose_auth_as_params", asbool),
+    # Tool filtering settings
+    "mcp.filter_forbidden_tools": ("filter_forbidden_tools", asbool),
+    # Automatic @tool scanning
+    "mcp.scan": ("scan", asbool),
+    # Concurrent batch handling
+    "mcp.batch_max_workers": ("batch_max_workers", int),
+}
+
+
+def _extract_mcp_config_from_settings(settings: dict) -> MCPConfiguration:
+    """Extract MCP configuration from Pyramid settings."""
+    kwargs = {
+        attribute: parse(settings[key])
+        for key, (attribute, parse) in _SETTINGS_MAP.items()
+        if key in settings
+    }
+    return MCPConfiguration(**kwargs)
+
+
 def _get_mcp_directive(config: Configurator) -> PyramidMCP:
     """Directive to get PyramidMCP instance from configurator."""
     return cast(PyramidMCP, cast(Any, config.registry).pyramid_mcp)
@@ -207,8 +234,10 @@ def _setup_mcp_complete(config: Configurator, pyramid_mcp: PyramidMCP) -> None:
     # This is called after all configuration is done via Pyramid's action system
     # At this point, all routes and views have been added and committed
 
-    # Scan for @tool decorated functions
-    config.scan(categories=["pyramid_mcp"])
+    # Scan for @tool decorated functions unless they are registered explicitly
+    # with config.add_mcp_tool (mcp.scan = false)
+    if pyramid_mcp.config.scan:
+        config.scan(categories=["pyramid_mcp"])
 
     # Discover and register tools from routes (routes were already added in includeme)
     pyramid_mcp.discover_tools()
@@ -15,6 +15,8 @@ from typing import Any
 import click
 from pyramid.paster import bootstrap
 
+from pyramid_mcp.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,7 +132,7 @@ def pstdio(ini: str, app: str, debug: bool) -> None:
 
                 try:
                     # Parse JSON-RPC request
-                    request_data = json.loads(line)
+                    request_data = loads(line)
 
                     # Log the incoming request from Claude
                     method = request_data.get("method", "unknown")
@@ -266,7 +268,7 @@ def pstdio(ini: str, app: str, debug: bool) -> None:
                     click.echo("─" * 60, err=True)
 
                     # Write JSON-RPC response to stdout
-                    print(json.dumps(response), flush=True)
+                    print(dumps(response), flush=True)
 
                 except json.JSONDecodeError as e:
                     error_msg = f"Invalid JSON from Claude: {e}"
@@ -280,7 +282,7 @@ def pstdio(ini: str, app: str, debug: bool) -> None:
                         "id": None,
                         "error": {"code": -32700, "message": "Parse error"},
                     }
-                    print(json.dumps(error_response), flush=True)
+                    print(dumps(error_response), flush=True)
 
                 except Exception as e:
                     error_msg = f"Error processing request: {e}"
@@ -303,7 +305,7 @@ def pstdio(ini: str, app: str, debug: bool) -> None:
                         ),
                         "error": {"code": -32603, "message": "Internal error"},
                     }
-                    print(json.dumps(error_response), flush=True)
+                    print(dumps(error_response), flush=True)
 
         except KeyboardInterrupt:
             click.echo("\n🛑 Keyboard interrupt received", err=True)
@@ -6,18 +6,21 @@ capabilities with Pyramid web applications.
 """
 
 
-import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pyramid.config import Configurator
 from pyramid.request import Request
 from pyramid.response import Response
 
 from pyramid_mcp.introspection import PyramidIntrospector
-from pyramid_mcp.protocol import MCPProtocolHandler
+from pyramid_mcp.protocol import PARSE_ERROR_RESPONSE, MCPProtocolHandler
+from pyramid_mcp.serialization import MCPJSONRenderer, dumps, loads
 from pyramid_mcp.wsgi import MCPWSGIApp
 
+# Renderer used for MCP HTTP responses, registered by _add_mcp_routes
+MCP_JSON_RENDERER = "mcp_json"
+
 
 @dataclass
 class MCPConfiguration:
@@ -43,6 +46,13 @@ class MCPConfiguration:
     expose_auth_as_params: bool = True
     # Tool filtering configuration
     filter_forbidden_tools: bool = True
+    # Scan the including package for @tool functions (see config.add_mcp_tool)
+    scan: bool = True
+    # Worker threads for handling JSON-RPC batch messages (1 = sequentially).
+    # With more than one worker, tools run concurrently on pool threads and
+    # must be thread-safe; their subrequests do not share the parent request's
+    # pyramid_tm transaction manager.
+    batch_max_workers: int = 1
 
 
 class PyramidMCP:
@@ -119,19 +129,7 @@ class PyramidMCP:
         if self.configurator:
             # Route discovery - only if enabled
             if self.config.route_discovery_enabled:
-                # Create a configuration object for route discovery
-                class RouteDiscoveryConfig:
-                    def __init__(self, mcp_config: Any) -> None:
-                        self.include_patterns = (
-                            mcp_config.route_discovery_include_patterns or []
-                        )
-                        self.exclude_patterns = (
-                            mcp_config.route_discovery_exclude_patterns or []
-                        )
-                        self.security_parameter = mcp_config.security_parameter
-                        self.expose_auth_as_params = mcp_config.expose_auth_as_params
-
-                discovery_config = RouteDiscoveryConfig(self.config)
+                discovery_config = self._get_discovery_config()
 
                 # Discover routes and convert to MCP tools
                 tools = self.introspector.discover_tools(discovery_config)
@@ -144,6 +142,23 @@ class PyramidMCP:
 
         self._tools_discovered = True
 
+    def _get_discovery_config(self) -> Any:
+        """Build the configuration object handed to the introspector."""
+
+        # Create a configuration object for route discovery
+        class RouteDiscoveryConfig:
+            def __init__(self, mcp_config: Any) -> None:
+                self.include_patterns = (
+                    mcp_config.route_discovery_include_patterns or []
+                )
+                self.exclude_patterns = (
+                    mcp_config.route_discovery_exclude_patterns or []
+                )
+                self.security_parameter = mcp_config.security_parameter
+                self.expose_auth_as_params = mcp_config.expose_auth_as_params
+
+        return RouteDiscoveryConfig(self.config)
+
     def _add_mcp_routes_only(self) -> None:
         """Add MCP routes without discovering tools (for includeme timing)."""
         if not self.configurator:
@@ -190,12 +205,13 @@ class PyramidMCP:
             # Add HTTP endpoint for MCP messages
             route_name = "mcp_http"
             route_path = f"/{mount_path}"
+            self.configurator.add_renderer(MCP_JSON_RENDERER, MCPJSONRenderer())
             self.configurator.add_route(route_name, route_path)
             self.configurator.add_view(
                 self._handle_mcp_http,
                 route_name=route_name,
                 request_method="POST",
-                renderer="json",
+                renderer=MCP_JSON_RENDERER,
             )
 
         if self.config.enable_sse:
@@ -209,28 +225,35 @@ class PyramidMCP:
                 request_method=["GET", "POST"],
             )
 
-    def _handle_mcp_http(self, request: Request) -> Dict[str, Any]:
+    def _handle_mcp_http(
+        self, request: Request
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Handle HTTP-based MCP messages.
 
         Args:
             request: Pyramid request object
 
         Returns:
-            MCP response as dictionary
+            MCP response as dictionary, or a list of responses for a batch
         """
-        message_data = None
         try:
             # Parse JSON request body
-            message_data = request.json_body
+            message_data = loads(request.body)
+        except ValueError:
+            return PARSE_ERROR_RESPONSE
 
+        try:
             # Get the context from the context factory (if any)
             # This integrates MCP with Pyramid's security system
 
             # Create authentication context for MCP protocol handler
             # Include both request and context for proper security integration
 
-            # Handle the message through protocol handler
-            response = self.protocol_handler.handle_message(message_data, request)
+            # Handle the message (or JSON-RPC batch) through protocol handler
+            if isinstance(message_data, list):
+                response = self.protocol_handler.handle_batch(message_data, request)
+            else:
+                response = self.protocol_handler.handle_message(message_data, request)
 
             # Check if this is a notification that should not receive a response
             if response is self.protocol_handler.NO_RESPONSE:
@@ -238,7 +261,7 @@ class PyramidMCP:
                 # (stdio transport handles this differently by not sending anything)
                 return {"jsonrpc": "2.0", "result": "ok"}
 
-            # Type cast since we know it's a dict if not NO_RESPONSE
+            # Type cast since we know it is a dict (or batch list) if not NO_RESPONSE
             return response  # type: ignore
 
         except Exception as e:
@@ -272,9 +295,13 @@ class PyramidMCP:
         def generate_sse() -> Any:
             """Generate SSE events."""
             if request.method == "POST":
-                message_data = None
                 try:
-                    message_data = request.json_body
+                    message_data = loads(request.body)
+                except ValueError:
+                    yield f"data: {dumps(PARSE_ERROR_RESPONSE)}\n\n".encode("utf-8")
+                    return
+
+                try:
                     response_data = self.protocol_handler.handle_message(
                         message_data, request
                     )
@@ -285,7 +312,7 @@ class PyramidMCP:
                         return
 
                     # Format as SSE
-                    sse_data = f"data: {json.dumps(response_data)}\n\n"
+                    sse_data = f"data: {dumps(response_data)}\n\n"
                     yield sse_data.encode("utf-8")
 
                 except Exception as e:
@@ -305,7 +332,7 @@ class PyramidMCP:
                             "message": f"Internal error: {str(e)}",
                         },
                     }
-                    sse_data = f"data: {json.dumps(error_response)}\n\n"
+                    sse_data = f"data: {dumps(error_response)}\n\n"
                     yield sse_data.encode("utf-8")
             else:
                 # GET request - send initial connection message
@@ -314,7 +341,7 @@ class PyramidMCP:
                     "method": "notifications/initialized",
                     "params": {},
                 }
-                sse_data = f"data: {json.dumps(welcome)}\n\n"
+                sse_data = f"data: {dumps(welcome)}\n\n"
                 yield sse_data.encode("utf-8")
 
         response = Response(
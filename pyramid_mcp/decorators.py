@@ -7,19 +7,26 @@ approach of creating Pyramid views with metadata.
 """
 
 import inspect
-from typing import Any, Callable, Optional, get_type_hints
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, get_type_hints
 
 import venusian  # type: ignore[import-untyped]
 from cornice import Service
 from cornice.validators import marshmallow_body_validator
 from marshmallow import Schema, fields
+from pyramid.exceptions import ConfigurationError
 
 from pyramid_mcp.security import MCPSecurityType
 
 
+@lru_cache(maxsize=256)
 def _generate_marshmallow_schema_from_signature(func: Callable) -> type:
     """Generate Marshmallow schema class from function signature for Cornice validation.
 
+    The schema only depends on the function signature, so it is reused by
+    subsequent config.scan() calls; the cache is bounded so that it does not
+    keep every scanned function alive.
+
     Args:
         func: Function to inspect
 
@@ -61,6 +68,37 @@ def _generate_marshmallow_schema_from_signature(func: Callable) -> type:
     return schema_class
 
 
+# Maximum number of memoized results kept per pure tool
+PURE_TOOL_CACHE_SIZE = 1024
+
+
+def _memoized_tool(func: Callable) -> Callable:
+    """Create the memoized wrapper of a pure tool function.
+
+    The @tool decorator creates it once and keeps it in the function's
+    ``__mcp_tool_settings__``, so every registration of the tool shares one
+    result cache. Calls with unhashable arguments bypass the cache.
+
+    Args:
+        func: Pure tool function
+
+    Returns:
+        Wrapper of the function exposing ``cache_info()`` and ``cache_clear()``
+    """
+    cached = lru_cache(maxsize=PURE_TOOL_CACHE_SIZE)(func)
+
+    def memoized(*args: Any, **kwargs: Any) -> Any:
+        try:
+            hash((args, tuple(kwargs.values())))
+        except TypeError:
+            return func(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    memoized.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    memoized.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return memoized
+
+
 class tool:
     """A function decorator which creates MCP tools as Cornice services.
 
@@ -76,6 +114,9 @@ class tool:
         permission: Pyramid permission requirement for this tool
         context: Context or context factory to use for permission checking
         security: Authentication parameter specification for this tool
+        pure: Whether the tool's result depends only on its arguments. Results
+            of pure tools are memoized; ``cache_info()`` and ``cache_clear()``
+            are exposed on the decorated function.
 
     Usage:
         >>> @tool(name="add", description="Add two numbers")
@@ -96,6 +137,7 @@ class tool:
         permission: Optional[str] = None,
         context: Optional[Any] = None,
         security: Optional[MCPSecurityType] = None,
+        pure: bool = False,
         **settings: Any,
     ):
         # Store all settings for later use in callback
@@ -109,6 +151,8 @@ class tool:
             settings["context"] = context
         if security is not None:
             settings["security"] = security
+        if pure:
+            settings["pure"] = pure
 
         self.__dict__.update(settings)
 
@@ -116,85 +160,124 @@ class tool:
         settings = self.__dict__.copy()
         depth = settings.pop("_depth", 0)
 
+        if settings.get("pure"):
+            memoized = _memoized_tool(wrapped)
+            settings["_memoized"] = memoized
+            wrapped.cache_info = memoized.cache_info  # type: ignore[attr-defined]
+            wrapped.cache_clear = memoized.cache_clear  # type: ignore[attr-defined]
+
+        # Keep the settings on the function so add_mcp_tool can register it
+        # explicitly, without a venusian scan
+        wrapped.__mcp_tool_settings__ = settings  # type: ignore[attr-defined]
+
         def callback(context: Any, name: str, ob: Callable[..., Any]) -> None:
             """Venusian callback to register the tool when config.scan() is called."""
-            config = context.config
-
-            tool_name = settings.get("name") or wrapped.__name__
-            tool_description = settings.get("description") or wrapped.__doc__
-            permission = settings.get("permission")
-            context_factory = settings.get("context")
-            security = settings.get("security")
-
-            # Generate unique route name and path for this tool
-            # NOTE: Don't use "mcp_" prefix as introspection excludes those routes
-            route_name = f"tool_{tool_name}"
-            route_path = f"/mcp/tools/{tool_name}"
-
-            # Generate schema class from function signature
-            schema_class = _generate_marshmallow_schema_from_signature(wrapped)
-
-            # Create Cornice service with optional context factory
-            service_init_kwargs = {
-                "name": route_name,
-                "path": route_path,
-                "description": tool_description or f"MCP tool: {tool_name}",
-            }
-
-            # Add context factory if specified
-            if context_factory:
-                service_init_kwargs["factory"] = context_factory
-
-            service = Service(**service_init_kwargs)
-
-            # Create service method with validation, error handling, and permission
-            service_kwargs = {
-                "schema": schema_class,
-                "validators": (marshmallow_body_validator,),
-            }
-
-            # Add permission if specified
-            if permission:
-                service_kwargs["permission"] = permission
-
-            # Add security configuration for introspection using configurable parameter
-            if security:
-                # Get the security parameter name from settings
-                security_param = config.registry.settings.get(
-                    "mcp.security_parameter", "mcp_security"
-                )
-                # Convert security schema to string representation for introspection
-                security_type_str = security.__class__.__name__.replace(
-                    "Schema", ""
-                )  # BearerAuthSchema -> BearerAuth
-                service_kwargs[security_param] = security_type_str
-
-            @service.post(**service_kwargs)  # type: ignore[misc]
-            def tool_endpoint(request: Any) -> Any:
-                """Tool endpoint function."""
-                try:
-                    # Extract validated arguments from request
-                    validated_data = request.validated
-
-                    # Call the original function with validated arguments
-                    result = wrapped(**validated_data)
-
-                    # Return just the result - protocol handler will wrap it
-                    return result
-
-                except Exception as e:
-                    # Return error message directly - protocol handler will wrap it
-                    return f"Error: {str(e)}"
-
-            # Set the tool endpoint's docstring to match the original function
-            if tool_description:
-                tool_endpoint.__doc__ = tool_description
-
-            # Register the service with config
-            # Cornice services are registered and auto-discovered by introspection
-            config.add_cornice_service(service)
+            _register_tool(context.config, wrapped, settings)
 
         # Attach venusian decorator for deferred registration
         self.venusian.attach(wrapped, callback, category="pyramid_mcp", depth=depth + 1)
 
         return wrapped
+
+
+def add_mcp_tool(config: Any, wrapped: Callable) -> None:
+    """Register a @tool decorated function without scanning for it.
+
+    This is exposed as the ``config.add_mcp_tool`` directive and is equivalent
+    to what ``config.scan()`` does for each @tool it finds.
+
+    Args:
+        config: Pyramid configurator
+        wrapped: Function decorated with @tool
+
+    Raises:
+        ConfigurationError: If the function is not decorated with @tool
+    """
+    settings = getattr(wrapped, "__mcp_tool_settings__", None)
+    if settings is None:
+        raise ConfigurationError(f"{wrapped!r} is not decorated with @tool")
+    _register_tool(config, wrapped, settings)
+
+
+def _register_tool(config: Any, wrapped: Callable, settings: Dict[str, Any]) -> None:
+    """Create and register the Cornice service backing a @tool function.
+
+    Args:
+        config: Pyramid configurator
+        wrapped: The decorated tool function
+        settings: The @tool decorator settings
+    """
+    tool_name = settings.get("name") or wrapped.__name__
+    tool_description = settings.get("description") or wrapped.__doc__
+    permission = settings.get("permission")
+    context_factory = settings.get("context")
+    security = settings.get("security")
+    call = settings.get("_memoized", wrapped)
+
+    # Generate unique route name and path for this tool
+    # NOTE: Don't use "mcp_" prefix as introspection excludes those routes
+    route_name = f"tool_{tool_name}"
+    route_path = f"/mcp/tools/{tool_name}"
+
+    # Generate schema class from function signature
+    schema_class = _generate_marshmallow_schema_from_signature(wrapped)
+
+    # Create Cornice service with optional context factory
+    service_init_kwargs = {
+        "name": route_name,
+        "path": route_path,
+        "description": tool_description or f"MCP tool: {tool_name}",
+    }
+
+    # Add context factory if specified
+    if context_factory:
+        service_init_kwargs["factory"] = context_factory
+
+    service = Service(**service_init_kwargs)
+
+    # Create service method with validation, error handling, and permission
+    service_kwargs = {
+        "schema": schema_class,
+        "validators": (marshmallow_body_validator,),
+    }
+
+    # Add permission if specified
+    if permission:
+        service_kwargs["permission"] = permission
+
+    # Add security configuration for introspection using configurable parameter
+    if security:
+        # Get the security parameter name from settings
+        security_param = config.registry.settings.get(
+            "mcp.security_parameter", "mcp_security"
+        )
+        # Convert security schema to string representation for introspection
+        security_type_str = security.__class__.__name__.replace(
+            "Schema", ""
+        )  # BearerAuthSchema -> BearerAuth
+        service_kwargs[security_param] = security_type_str
+
+    @service.post(**service_kwargs)  # type: ignore[misc]
+    def tool_endpoint(request: Any) -> Any:
+        """Tool endpoint function."""
+        try:
+            # Extract validated arguments from request
+            validated_data = request.validated
+
+            # Call the original (or memoized) function with validated arguments
+            result = call(**validated_data)
+
+            # Return just the result - protocol handler will wrap it
+            return result
+
+        except Exception as e:
+            # Return error message directly - protocol handler will wrap it
+            return f"Error: {str(e)}"
+
+    # Set the tool endpoint's docstring to match the original function
+    if tool_description:
+        tool_endpoint.__doc__ = tool_description
+
+    # Register the service with config
+    # Cornice services are registered and auto-discovered by introspection
+    config.add_cornice_service(service)
@@ -48,6 +48,15 @@ class PyramidIntrospector:
         """
         return discover_routes(self.configurator, discover_cornice_services)
 
+    def configure(self, config: Any) -> None:
+        """Apply discovery configuration without walking any routes.
+
+        Args:
+            config: Configuration object with the security parameter name
+        """
+        # Store the security parameter for use in other methods
+        self._security_parameter = config.security_parameter
+
     def discover_tools(self, config: Any) -> List[MCPTool]:
         """Discover routes and convert them to MCP tools.
 
@@ -57,8 +66,7 @@ class PyramidIntrospector:
         Returns:
             List of MCPTool objects
         """
-        # Store the security parameter for use in other methods
-        self._security_parameter = config.security_parameter
+        self.configure(config)
 
         tools: List[MCPTool] = []
 
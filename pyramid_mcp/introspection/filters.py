@@ -6,11 +6,23 @@ including pattern matching, exclusion rules, and include/exclude patterns.
 """
 
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Pattern
 
 from pyramid_mcp.protocol import MCPTool
 
 
+@lru_cache(maxsize=256)
+def _wildcard_regex(pattern: str) -> Pattern[str]:
+    """Compile a wildcard pattern ('*' and '?') into an anchored regex.
+
+    Patterns come from the MCP settings and are matched against every route
+    and tool, so each one is translated and compiled once.
+    """
+    pattern_regex = pattern.replace("*", ".*").replace("?", ".")
+    return re.compile(f"^{pattern_regex}$")
+
+
 def should_exclude_route(route_info: Dict[str, Any], config: Any) -> bool:
     """Check if a route should be excluded from MCP tool generation.
 
@@ -88,10 +100,8 @@ def tool_pattern_matches(pattern: str, tool_name: str) -> bool:
     """
     # Handle wildcard patterns
     if "*" in pattern or "?" in pattern:
-        # Pattern with wildcards - convert to regex
-        pattern_regex = pattern.replace("*", ".*").replace("?", ".")
-        pattern_regex = f"^{pattern_regex}$"
-        return bool(re.match(pattern_regex, tool_name))
+        # Pattern with wildcards - match its compiled regex
+        return bool(_wildcard_regex(pattern).match(tool_name))
     else:
         # Exact pattern - should match as prefix or exact match
         return tool_name == pattern or tool_name.startswith(pattern + "_")
@@ -113,14 +123,11 @@ def pattern_matches_route(pattern: str, route_pattern: str, route_name: str) ->
 
     # Handle wildcard patterns
     if "*" in pattern or "?" in pattern:
-        # Pattern with wildcards - convert to regex
-        pattern_regex = pattern.replace("*", ".*").replace("?", ".")
-        pattern_regex = f"^{pattern_regex}$"
-
-        # Check against both route pattern and name
+        # Pattern with wildcards - match its compiled regex against both
+        # the route pattern and name
+        pattern_regex = _wildcard_regex(pattern)
         return bool(
-            re.match(pattern_regex, normalized_route)
-            or re.match(pattern_regex, route_name)
+            pattern_regex.match(normalized_route) or pattern_regex.match(route_name)
         )
     else:
         # Exact pattern - should match as prefix for routes and
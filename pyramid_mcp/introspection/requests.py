@@ -5,7 +5,6 @@ This module handles subrequest creation, parameter processing,
 response conversion, and transaction configuration.
 """
 
-import json
 import logging
 import re
 import traceback
@@ -15,6 +14,7 @@ from urllib.parse import urlencode
 from pyramid.request import Request
 
 from pyramid_mcp.schemas import MCPContextResultSchema
+from pyramid_mcp.serialization import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -243,17 +243,17 @@ def create_subrequest(
     # Set request body for POST/PUT/PATCH requests
     if method.upper() in ["POST", "PUT", "PATCH"] and json_body:
         # ⚠️ CRITICAL: This is where content type is hardcoded!
-        body_json = json.dumps(json_body)
-        subrequest.body = body_json.encode("utf-8")
+        body_json = dumps_bytes(json_body)
+        subrequest.body = body_json
         subrequest.content_type = "application/json"
 
         # 🐛 DEBUG: Log the critical content type setting
         logger.warning(
             "🚨 HARDCODED CONTENT TYPE: Setting Content-Type to " "'application/json'"
         )
-        logger.warning(f"🚨 Request body size: {len(body_json)} characters")
+        logger.warning(f"🚨 Request body size: {len(body_json)} bytes")
         logger.warning(
-            f"🚨 Request body preview: {body_json[:200]}"
+            f"🚨 Request body preview: {body_json[:200].decode('utf-8', 'replace')}"
             f"{'...' if len(body_json) > 200 else ''}"
         )
         logger.warning(
@@ -54,6 +54,12 @@ def discover_routes(
                     view_by_route[route_name] = []
                 view_by_route[route_name].append(view_intr)
 
+        # Template introspectables are matched against every view below
+        template_category = introspector.get_category("templates") or []
+        template_introspectables = [
+            item["introspectable"] for item in template_category
+        ]
+
         # Permissions are directly available in view introspectables
         # No need for complex extraction - Pyramid stores them directly
 
@@ -104,7 +110,9 @@ def discover_routes(
                 view_callable = view_intr.get("callable")
                 if view_callable:
                     # Get permission from introspectable or related permissions
-                    permission = extract_permission(view_intr, configurator)
+                    permission = extract_permission(
+                        view_intr, configurator, introspector
+                    )
 
                     view_info = {
                         "callable": view_callable,
@@ -144,10 +152,6 @@ def discover_routes(
                         view_info["cornice_metadata"] = cornice_metadata
 
                     # Try to get renderer information from templates
-                    template_category = introspector.get_category("templates") or []
-                    template_introspectables = [
-                        item["introspectable"] for item in template_category
-                    ]
                     for template_intr in template_introspectables:
                         # Match templates to views - this is a heuristic approach
                         # since templates don't directly reference view callables
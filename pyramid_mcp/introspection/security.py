@@ -5,12 +5,39 @@ This module handles security schema conversion and authentication processing.
 """
 
 import logging
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from pyramid_mcp.security import BasicAuthSchema, BearerAuthSchema
 
 logger = logging.getLogger(__name__)
 
+# Accepted spellings of each security type (lowercase, hyphens as underscores)
+# and their schema class
+SECURITY_TYPE_SCHEMAS: Dict[str, type] = {
+    # Various forms of Bearer authentication
+    "bearer": BearerAuthSchema,
+    "bearerauth": BearerAuthSchema,
+    "bearer_auth": BearerAuthSchema,
+    "jwt": BearerAuthSchema,
+    # Various forms of Basic authentication
+    "basic": BasicAuthSchema,
+    "basicauth": BasicAuthSchema,
+    "basic_auth": BasicAuthSchema,
+}
+
+
+@lru_cache(maxsize=32)
+def _security_schema_class(security_type: str) -> Optional[type]:
+    """Resolve a security type string to its schema class.
+
+    The string is lowercased and hyphens become underscores, so "Bearer-Auth"
+    resolves like "bearer_auth". Memoized on the raw string, so repeated
+    lookups during route introspection skip the normalization. The class (not
+    an instance) is cached because schema instances are mutable.
+    """
+    return SECURITY_TYPE_SCHEMAS.get(security_type.lower().replace("-", "_"))
+
 
 def convert_security_type_to_schema(security_type: str) -> Optional[Any]:
     """Convert string security type to appropriate schema object.
@@ -21,14 +48,6 @@ def convert_security_type_to_schema(security_type: str) -> Optional[Any]:
     Returns:
         Appropriate security schema object or None if unknown
     """
-    security_type_lower = security_type.lower()
-
-    # Handle various forms of Bearer authentication
-    if security_type_lower in ["bearer", "bearerauth", "bearer_auth", "jwt"]:
-        return BearerAuthSchema()
-    # Handle various forms of Basic authentication
-    elif security_type_lower in ["basic", "basicauth", "basic_auth"]:
-        return BasicAuthSchema()
-    else:
-        # Unknown security type, return None
-        return None
+    schema_class = _security_schema_class(security_type)
+    # Unknown security type, return None
+    return schema_class() if schema_class else None
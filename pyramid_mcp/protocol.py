@@ -10,8 +10,11 @@ import hashlib
 import json
 import logging
 import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Callable, Dict, List, Optional, Set, Union, cast
 from urllib.parse import urlencode
 
@@ -30,6 +33,7 @@ from pyramid_mcp.schemas import (
     MCPResponseSchema,
 )
 from pyramid_mcp.security import MCPSecurityType, merge_auth_into_schema
+from pyramid_mcp.serialization import dumps_bytes
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -37,6 +41,9 @@ logger = logging.getLogger(__name__)
 # Claude Desktop client validation pattern for tool names
 CLAUDE_TOOL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
 
+# Keywords indexed for tool search: lowercase alphanumeric runs of 3+ chars
+TOOL_KEYWORD_PATTERN = re.compile(r"[a-z0-9]{3,}")
+
 
 def validate_tool_name(name: str) -> bool:
     """
@@ -51,6 +58,13 @@ def validate_tool_name(name: str) -> bool:
     return bool(CLAUDE_TOOL_NAME_PATTERN.match(name))
 
 
+def _tool_keywords(text: Optional[str]) -> Set[str]:
+    """Split text into the lowercase keywords used by the tool search index."""
+    if not text:
+        return set()
+    return set(TOOL_KEYWORD_PATTERN.findall(text.lower()))
+
+
 def sanitize_tool_name(name: str, used_names: Optional[Set[str]] = None) -> str:
     """
     Sanitize a tool name to meet Claude Desktop requirements.
@@ -121,7 +135,7 @@ def sanitize_tool_name(name: str, used_names: Optional[Set[str]] = None) -> str:
     raise ValueError(f"Could not generate unique name for '{name}' after 1000 attempts")
 
 
-class MCPErrorCode(Enum):
+class MCPErrorCode(IntEnum):
     """Standard MCP error codes based on JSON-RPC 2.0."""
 
     PARSE_ERROR = -32700
@@ -131,6 +145,14 @@ class MCPErrorCode(Enum):
     INTERNAL_ERROR = -32603
 
 
+# Answer to a body that is not valid JSON; the request id cannot be known
+PARSE_ERROR_RESPONSE: Dict[str, Any] = {
+    "jsonrpc": "2.0",
+    "id": None,
+    "error": {"code": MCPErrorCode.PARSE_ERROR.value, "message": "Parse error"},
+}
+
+
 @dataclass
 class MCPTool:
     """Represents an MCP tool that can be called by clients."""
@@ -180,6 +202,11 @@ class MCPTool:
         return tool_dict
 
 
+def _mark_batch_worker(batch_local: threading.local) -> None:
+    """Flag the current thread as a batch worker (ThreadPoolExecutor initializer)."""
+    batch_local.active = True
+
+
 class MCPProtocolHandler:
     """Handles MCP protocol messages and routing."""
 
@@ -207,6 +234,54 @@ class MCPProtocolHandler:
         }
         # Track used tool names to prevent collisions
         self._used_tool_names: Set[str] = set()
+        # Lazily built tool descriptors (tool name -> to_dict() output),
+        # invalidated whenever a tool is registered
+        self._tool_dicts_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        # Unfiltered tools/list payload, invalidated together with the above
+        self._tools_list_cache: Optional[List[Dict[str, Any]]] = None
+        # Inverted index mapping name/description keywords to tool names
+        self._keyword_index: Dict[str, Set[str]] = {}
+        # Schemas are stateless between load/dump calls, so one instance of each
+        # is reused for every message instead of being rebuilt per call
+        self._request_schema = MCPRequestSchema()
+        self._context_result_schema = MCPContextResultSchema()
+        # Thread pool for concurrent batch handling; its threads start lazily.
+        # Pool threads flag themselves in _batch_local so that subrequests they
+        # build do not share the parent request's transaction manager.
+        self._batch_local = threading.local()
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        if config is not None and config.batch_max_workers > 1:
+            self._batch_executor = ThreadPoolExecutor(
+                max_workers=config.batch_max_workers,
+                thread_name_prefix="pyramid-mcp-batch",
+                initializer=_mark_batch_worker,
+                initargs=(self._batch_local,),
+            )
+            # Shut the pool down when the handler is collected or at exit
+            self._batch_executor_finalizer = weakref.finalize(
+                self, self._batch_executor.shutdown, wait=False
+            )
+        # Dispatch table mapping JSON-RPC method names to their handlers.
+        # Every handler is called as handler(mcp_request, request).
+        self._method_handlers: Dict[
+            str, Callable[..., Union[Dict[str, Any], object]]
+        ] = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_list_tools,
+            "tools/call": self._handle_call_tool,
+            "resources/list": self._handle_list_resources,
+            "prompts/list": self._handle_list_prompts,
+            "notifications/initialized": self._handle_notifications_initialized,
+        }
+
+    def close(self) -> None:
+        """Shut down the batch thread pool, if any.
+
+        Batches handled after closing are handled sequentially.
+        """
+        if self._batch_executor is not None:
+            self._batch_executor_finalizer()
+            self._batch_executor = None
 
     def register_tool(self, tool: MCPTool, config: Optional[Any] = None) -> None:
         """Register an MCP tool.
@@ -231,10 +306,33 @@ class MCPProtocolHandler:
         # Register the tool
         self.tools[sanitized_name] = tool
         self._used_tool_names.add(sanitized_name)
+        self._tool_dicts_cache = None
+        self._tools_list_cache = None
+        for keyword in _tool_keywords(tool.name) | _tool_keywords(tool.description):
+            self._keyword_index.setdefault(keyword, set()).add(sanitized_name)
 
         # Update capabilities to indicate we have tools
         self.capabilities["tools"] = {}
 
+    def find_tools(self, query: str) -> List[str]:
+        """Find registered tools by keyword.
+
+        The query is split into keywords the same way tool names and
+        descriptions are indexed at registration time, so lookups don't scan
+        every registered tool.
+
+        Args:
+            query: Keywords to search for, e.g. "user list"
+
+        Returns:
+            Names of the matching tools, the ones matching most keywords first
+        """
+        scores: Dict[str, int] = {}
+        for keyword in _tool_keywords(query):
+            for name in self._keyword_index.get(keyword, ()):
+                scores[name] = scores.get(name, 0) + 1
+        return sorted(scores, key=lambda name: (-scores[name], name))
+
     def handle_message(
         self,
         message_data: Dict[str, Any],
@@ -251,8 +349,7 @@ class MCPProtocolHandler:
         """
         try:
             # Parse and validate the request using schema
-            schema = MCPRequestSchema()
-            mcp_request = cast(Dict[str, Any], schema.load(message_data))
+            mcp_request = cast(Dict[str, Any], self._request_schema.load(message_data))
         except ValidationError as validation_error:
             # Handle Marshmallow validation errors
             # For malformed requests (missing required fields), JSON-RPC spec
@@ -278,34 +375,11 @@ class MCPProtocolHandler:
             )
 
         try:
-            # Route to appropriate handler
-            if mcp_request["method"] == "initialize":
-                return self._handle_initialize(mcp_request)
-            elif mcp_request["method"] == "tools/list":
-                return self._handle_list_tools(mcp_request, request)
-            elif mcp_request["method"] == "tools/call":
-                return self._handle_call_tool(mcp_request, request)
-            elif mcp_request["method"] == "resources/list":
-                return self._handle_list_resources(mcp_request)
-            elif mcp_request["method"] == "prompts/list":
-                return self._handle_list_prompts(mcp_request)
-            elif mcp_request["method"] == "notifications/initialized":
-                # Notifications don't expect responses according to JSON-RPC 2.0 spec
-                self._handle_notifications_initialized(mcp_request)
-                return self.NO_RESPONSE
-            else:
-                return cast(
-                    Dict[str, Any],
-                    MCPResponseSchema().dump(
-                        {
-                            "id": mcp_request.get("id"),
-                            "error_code": MCPErrorCode.METHOD_NOT_FOUND.value,
-                            "error_message": (
-                                f"Method '{mcp_request['method']}' not found"
-                            ),
-                        }
-                    ),
-                )
+            # Route to appropriate handler via the method dispatch table
+            handler = self._method_handlers.get(mcp_request["method"])
+            if handler is None:
+                return self._handle_method_not_found(mcp_request)
+            return handler(mcp_request, request)
 
         except Exception as e:
             # Try to extract request ID if possible
@@ -327,36 +401,136 @@ class MCPProtocolHandler:
                 ),
             )
 
-    def _handle_initialize(self, mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_batch(
+        self,
+        messages: List[Any],
+        request: Request,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any], object]:
+        """Handle a JSON-RPC 2.0 batch of MCP messages.
+
+        Each message is handled through handle_message, sharing the same
+        pyramid request. When the configuration allows more than one batch
+        worker, the messages are handled concurrently in a thread pool that is
+        reused across batches. Responses are always returned in message order.
+
+        In that case tools run on pool threads: they must be thread-safe, and
+        their subrequests do not inherit the parent request's transaction
+        manager (request.tm), which is bound to the request thread.
+
+        Args:
+            messages: The parsed JSON batch (a list of messages)
+            request: The pyramid request
+
+        Returns:
+            The list of responses with notifications omitted, NO_RESPONSE if the
+            batch only contained notifications, or an invalid request error
+            for an empty batch
+        """
+        if not messages:
+            return cast(
+                Dict[str, Any],
+                MCPResponseSchema().dump(
+                    {
+                        "id": None,
+                        "error_code": MCPErrorCode.INVALID_REQUEST.value,
+                        "error_message": "Invalid request: empty batch",
+                    }
+                ),
+            )
+
+        if self._batch_executor is not None and len(messages) > 1:
+            results = list(
+                self._batch_executor.map(
+                    lambda message_data: self.handle_message(message_data, request),
+                    messages,
+                )
+            )
+        else:
+            results = [
+                self.handle_message(message_data, request) for message_data in messages
+            ]
+
+        responses = [
+            cast(Dict[str, Any], response)
+            for response in results
+            if response is not self.NO_RESPONSE
+        ]
+
+        return responses if responses else self.NO_RESPONSE
+
+    def _success_response(self, request_id: Any, result: Any) -> Dict[str, Any]:
+        """Build a JSON-RPC success envelope.
+
+        Produces the same dictionary as ``MCPResponseSchema().dump`` for a
+        result, without instantiating the schema on every response. Error
+        responses still go through the schema.
+
+        Args:
+            request_id: ID of the request being answered
+            result: Response result
+
+        Returns:
+            The response message as a dictionary
+        """
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _handle_method_not_found(self, mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the error response for an unknown JSON-RPC method."""
+        return cast(
+            Dict[str, Any],
+            MCPResponseSchema().dump(
+                {
+                    "id": mcp_request.get("id"),
+                    "error_code": MCPErrorCode.METHOD_NOT_FOUND.value,
+                    "error_message": f"Method '{mcp_request['method']}' not found",
+                }
+            ),
+        )
+
+    def _handle_initialize(
+        self, mcp_request: Dict[str, Any], request: Optional[Request] = None
+    ) -> Dict[str, Any]:
         """Handle MCP initialize request."""
         result = {
             "protocolVersion": "2024-11-05",
             "capabilities": self.capabilities,
             "serverInfo": {"name": self.server_name, "version": self.server_version},
         }
-        return cast(
-            Dict[str, Any],
-            MCPResponseSchema().dump({"id": mcp_request.get("id"), "result": result}),
-        )
+        return self._success_response(mcp_request.get("id"), result)
+
+    def _get_tool_dicts(self) -> Dict[str, Dict[str, Any]]:
+        """Get the MCP descriptors of all registered tools, keyed by tool name.
+
+        The descriptors are built once and reused until the next registration.
+        """
+        if self._tool_dicts_cache is None:
+            self._tool_dicts_cache = {
+                name: tool.to_dict() for name, tool in self.tools.items()
+            }
+        return self._tool_dicts_cache
+
+    def _get_tools_list(self) -> List[Dict[str, Any]]:
+        """Get the unfiltered tools/list payload in registration order.
+
+        The list is built once and reused until the next registration.
+        """
+        if self._tools_list_cache is None:
+            self._tools_list_cache = list(self._get_tool_dicts().values())
+        return self._tools_list_cache
 
     def _handle_list_tools(
         self, mcp_request: Dict[str, Any], request: Optional[Request] = None
     ) -> Dict[str, Any]:
         """Handle MCP tools/list request."""
-        # Get all tools
-        all_tools = list(self.tools.values())
-
         # Filter tools based on permissions if configured
         if self.config and self.config.filter_forbidden_tools and request:
+            all_tools = list(self.tools.values())
             tools_list = self._filter_accessible_tools(all_tools, request)
         else:
-            tools_list = [tool.to_dict() for tool in all_tools]
+            tools_list = self._get_tools_list()
 
         result = {"tools": tools_list}
-        return cast(
-            Dict[str, Any],
-            MCPResponseSchema().dump({"id": mcp_request.get("id"), "result": result}),
-        )
+        return self._success_response(mcp_request.get("id"), result)
 
     def _filter_accessible_tools(
         self, tools: List[MCPTool], request: Request
@@ -371,13 +545,14 @@ class MCPProtocolHandler:
             List of tool dictionaries for accessible tools only
         """
         accessible_tools = []
+        tool_dicts = self._get_tool_dicts()
 
         # Get security policy
         policy = request.registry.queryUtility(ISecurityPolicy)
         if not policy:
             # No security policy configured, return all tools
             logger.debug("No security policy found, returning all tools")
-            return [tool.to_dict() for tool in tools]
+            return [tool_dicts[tool.name] for tool in tools]
 
         logger.debug(f"Filtering {len(tools)} tools based on permissions")
 
@@ -386,7 +561,7 @@ class MCPProtocolHandler:
             is_accessible = self._check_tool_permission(tool, request, policy)
 
             if is_accessible:
-                accessible_tools.append(tool.to_dict())
+                accessible_tools.append(tool_dicts[tool.name])
 
         logger.debug(
             f"Filtered tools: {len(accessible_tools)}/{len(tools)} tools accessible"
@@ -469,7 +644,8 @@ class MCPProtocolHandler:
                 ),
             )
 
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return cast(
                 Dict[str, Any],
                 MCPResponseSchema().dump(
@@ -481,7 +657,6 @@ class MCPProtocolHandler:
                 ),
             )
 
-        tool = self.tools[tool_name]
         logger.debug(f"📞 MCP Tool Call: {tool_name} with arguments: {tool_args}")
 
         try:
@@ -497,7 +672,7 @@ class MCPProtocolHandler:
             response = request.invoke_subrequest(subrequest)
 
             # Transform response to MCP context format using schema
-            schema = MCPContextResultSchema()
+            schema = self._context_result_schema
 
             # Prepare data for schema transformation
             view_info = {
@@ -517,12 +692,7 @@ class MCPProtocolHandler:
             # Transform and return directly using schema
             mcp_result = schema.dump(schema_data)
             logger.debug("✅ Tool execution completed successfully")
-            return cast(
-                Dict[str, Any],
-                MCPResponseSchema().dump(
-                    {"id": mcp_request.get("id"), "result": mcp_result}
-                ),
-            )
+            return self._success_response(mcp_request.get("id"), mcp_result)
 
         except Exception as e:
             logger.error(f"❌ Error executing tool '{tool_name}': {str(e)}")
@@ -695,8 +865,7 @@ class MCPProtocolHandler:
         # Set up request body for POST/PUT/PATCH requests
         if method.upper() in ["POST", "PUT", "PATCH"] and body_data:
             subrequest.content_type = "application/json"
-            body_json = json.dumps(body_data).encode("utf-8")
-            subrequest.body = body_json
+            subrequest.body = dumps_bytes(body_data)
 
         return subrequest
 
@@ -714,8 +883,11 @@ class MCPProtocolHandler:
         # Copy registry and security policy (let security policy compute the rest)
         subrequest.registry = request.registry
 
-        # Copy transaction manager if available (for pyramid_tm integration)
-        if hasattr(request, "tm"):
+        # Copy transaction manager if available (for pyramid_tm integration).
+        # Batch worker threads must not share it: transaction managers and the
+        # sessions joined to them are bound to the thread of the parent request.
+        in_batch_worker = getattr(self._batch_local, "active", False)
+        if hasattr(request, "tm") and not in_batch_worker:
             subrequest.tm = request.tm
 
         # Copy important environ variables (but not request-specific ones)
@@ -731,8 +903,11 @@ class MCPProtocolHandler:
         }
 
         for key, value in request.environ.items():
-            if key not in request_specific_keys:
-                subrequest.environ[key] = value
+            if key in request_specific_keys:
+                continue
+            if in_batch_worker and key.startswith("tm."):
+                continue
+            subrequest.environ[key] = value
 
         # CRITICAL: Resolve the route to get proper context and matchdict
         # This ensures context factories are applied and ACLs work for ALL tools
@@ -758,34 +933,30 @@ class MCPProtocolHandler:
             # Create the context using the factory
             subrequest.context = context_factory(subrequest)
 
-    def _handle_list_resources(self, mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_list_resources(
+        self, mcp_request: Dict[str, Any], request: Optional[Request] = None
+    ) -> Dict[str, Any]:
         """Handle MCP resources/list request."""
         # For now, return empty resources list
         # This can be extended to support MCP resources in the future
         result: Dict[str, Any] = {"resources": []}
-        return cast(
-            Dict[str, Any],
-            MCPResponseSchema().dump({"id": mcp_request.get("id"), "result": result}),
-        )
+        return self._success_response(mcp_request.get("id"), result)
 
-    def _handle_list_prompts(self, mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_list_prompts(
+        self, mcp_request: Dict[str, Any], request: Optional[Request] = None
+    ) -> Dict[str, Any]:
         """Handle MCP prompts/list request."""
         # For now, return empty prompts list
         # This can be extended to support MCP prompts in the future
         result: Dict[str, Any] = {"prompts": []}
-        return cast(
-            Dict[str, Any],
-            MCPResponseSchema().dump({"id": mcp_request.get("id"), "result": result}),
-        )
+        return self._success_response(mcp_request.get("id"), result)
 
     def _handle_notifications_initialized(
-        self, mcp_request: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+        self, mcp_request: Dict[str, Any], request: Optional[Request] = None
+    ) -> object:
         """Handle MCP notifications/initialized request."""
-        # This is a notification - no response should be sent for notifications
-        # But since our current architecture expects a response, we'll return None
-        # and handle this special case in the main handler
-        return None
+        # Notifications don't expect responses according to JSON-RPC 2.0 spec
+        return self.NO_RESPONSE
 
 
 def create_json_schema_from_marshmallow(schema_class: type) -> Dict[str, Any]:
@@ -0,0 +1,100 @@
+"""
+JSON Serialization for MCP Transports
+
+This module provides the JSON encoding and decoding used on the MCP transport
+paths (HTTP, SSE, WSGI and stdio). When orjson is installed (the ``orjson``
+extra) it is used for faster encoding and decoding; otherwise the standard
+library json module is used.
+
+The two backends agree on ordinary MCP payloads, with these differences
+under orjson:
+
+- Integers outside the 64-bit range are encoded by falling back to the
+  standard library, but are decoded as floats by ``loads``.
+- NaN and Infinity are encoded as ``null`` instead of the non-standard
+  ``NaN``/``Infinity`` literals, and those literals are rejected by ``loads``.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from pyramid.renderers import JSON
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        default: Optional callable for objects that are not JSON serializable
+
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects what the stdlib can still encode (such as
+            # integers beyond 64 bits); the stdlib raises if it cannot either
+            pass
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        default: Optional callable for objects that are not JSON serializable
+
+    Returns:
+        JSON document as a string
+    """
+    if HAS_ORJSON:
+        return dumps_bytes(obj, default=default).decode("utf-8")
+    return json.dumps(obj, default=default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or UTF-8 encoded bytes
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class MCPJSONRenderer(JSON):
+    """Pyramid JSON renderer that emits UTF-8 bytes via dumps_bytes.
+
+    Returning bytes lets Pyramid set the response body directly instead of
+    encoding a str. Content type handling and ``__json__``/adapter support
+    match Pyramid's JSON renderer.
+    """
+
+    def __call__(self, info: Any) -> Callable[[Any, Dict[str, Any]], bytes]:
+        def _render(value: Any, system: Dict[str, Any]) -> bytes:
+            request = system.get("request")
+            if request is not None:
+                response = request.response
+                if response.content_type == response.default_content_type:
+                    response.content_type = "application/json"
+            return dumps_bytes(value, default=self._make_default(request))
+
+        return _render
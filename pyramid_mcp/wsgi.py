@@ -4,12 +4,12 @@ WSGI Module for MCP Server
 This module provides a WSGI application that serves the MCP protocol.
 """
 
-import json
 from typing import Any, Callable, Dict, Iterable
 
 from pyramid.request import Request
 
-from pyramid_mcp.protocol import MCPProtocolHandler
+from pyramid_mcp.protocol import PARSE_ERROR_RESPONSE, MCPProtocolHandler
+from pyramid_mcp.serialization import dumps, dumps_bytes, loads
 
 
 class MCPWSGIApp:
@@ -65,24 +65,22 @@ class MCPWSGIApp:
         Returns:
             Response iterable
         """
+        request_data = None
         try:
             # Read request body
             content_length = int(environ.get("CONTENT_LENGTH", 0))
             request_body = environ["wsgi.input"].read(content_length)
 
-            # Parse JSON
-            request_data = json.loads(request_body.decode("utf-8"))
-
-            # Handle through protocol handler
-            # Create a dummy request for WSGI context (no Pyramid request available)
-            dummy_request = Request.blank("/")
-            response_data = self.protocol_handler.handle_message(
-                request_data, dummy_request
-            )
+            # Parse JSON; invalid documents get a JSON-RPC parse error
+            try:
+                request_data = loads(request_body)
+            except ValueError:
+                response_data = PARSE_ERROR_RESPONSE
+            else:
+                response_data = self._handle_parsed_request(request_data)
 
             # Return JSON response
-            response_json = json.dumps(response_data)
-            response_bytes = response_json.encode("utf-8")
+            response_bytes = dumps_bytes(response_data)
 
             start_response(
                 "200 OK",
@@ -108,8 +106,7 @@ class MCPWSGIApp:
                 "id": request_id,
                 "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
             }
-            response_json = json.dumps(error_response)
-            response_bytes = response_json.encode("utf-8")
+            response_bytes = dumps_bytes(error_response)
 
             start_response(
                 "500 Internal Server Error",
@@ -121,6 +118,32 @@ class MCPWSGIApp:
 
             return [response_bytes]
 
+    def _handle_parsed_request(self, request_data: Any) -> Any:
+        """Handle a parsed JSON-RPC message or batch through the protocol handler.
+
+        Args:
+            request_data: The decoded JSON request body
+
+        Returns:
+            The JSON-RPC response data to send back
+        """
+        # Create a dummy request for WSGI context (no Pyramid request available)
+        dummy_request = Request.blank("/")
+        if isinstance(request_data, list):
+            response_data = self.protocol_handler.handle_batch(
+                request_data, dummy_request
+            )
+        else:
+            response_data = self.protocol_handler.handle_message(
+                request_data, dummy_request
+            )
+
+        # Notifications (and batches of only notifications) get the same
+        # minimal acknowledgement as on the Pyramid HTTP endpoint
+        if response_data is self.protocol_handler.NO_RESPONSE:
+            return {"jsonrpc": "2.0", "result": "ok"}
+        return response_data
+
     def _handle_sse_request(
         self, environ: Dict[str, Any], start_response: Callable
     ) -> Iterable[bytes]:
@@ -149,6 +172,6 @@ class MCPWSGIApp:
             "method": "notifications/initialized",
             "params": {},
         }
-        sse_data = f"data: {json.dumps(welcome_msg)}\n\n"
+        sse_data = f"data: {dumps(welcome_msg)}\n\n"
 
         return [sse_data.encode("utf-8")]
@@ -3,10 +3,12 @@ Test MCP client interactions with pyramid-mcp using WebTest.
 Tests how a real MCP client would interact with auto-discovered tools.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
+from pyramid_mcp.serialization import dumps_bytes
+
 
 class MCPClientSimulator:
     """Simulates MCP client interactions for testing using WebTest."""
@@ -20,6 +22,13 @@ class MCPClientSimulator:
         self.request_id += 1
         return self.request_id
 
+    def _post(self, payload: Any) -> Any:
+        """POST a JSON-RPC message or batch, serialized with dumps_bytes."""
+        response = self.testapp.post(
+            "/mcp", dumps_bytes(payload), content_type="application/json"
+        )
+        return response.json
+
     def call_mcp(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Make an MCP JSON-RPC call using WebTest."""
         request = {
@@ -28,13 +37,34 @@ class MCPClientSimulator:
             "method": method,
             "params": params or {},
         }
-        response = self.testapp.post_json("/mcp", request)
-        return response.json
+        return self._post(request)
+
+    def call_mcp_batch(
+        self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Any]:
+        """Make several MCP calls as one JSON-RPC batch request.
+
+        Returns the responses in the order of the calls, matched by request id.
+        """
+        requests = [
+            {
+                "jsonrpc": "2.0",
+                "id": self._next_id(),
+                "method": method,
+                "params": params or {},
+            }
+            for method, params in calls
+        ]
+        responses = {result["id"]: result for result in self._post(requests)}
+        return [responses[request["id"]] for request in requests]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_client_test_config(pyramid_app):
-    """Test-specific fixture: Configure pyramid for MCP client tests."""
+    """Module fixture: Configure pyramid for MCP client tests.
+
+    The tests only call tools that do not change the app, so one app is shared.
+    """
 
     # Configure pyramid with MCP client test settings
     settings = {
@@ -54,12 +84,18 @@ def mcp_client(mcp_client_test_config: Any) -> MCPClientSimulator:
     return MCPClientSimulator(mcp_client_test_config)
 
 
+@pytest.fixture(scope="module")
+def tools_list_response(mcp_client_test_config: Any) -> Any:
+    """Module fixture: tools/list response for the read-only discovery tests."""
+    return MCPClientSimulator(mcp_client_test_config).call_mcp("tools/list")
+
+
 # Tool Discovery Tests
 
 
-def test_list_tools(mcp_client: MCPClientSimulator) -> None:
+def test_list_tools(tools_list_response: Any) -> None:
     """Test that MCP tools can be discovered."""
-    response = mcp_client.call_mcp("tools/list")
+    response = tools_list_response
 
     assert "result" in response
     assert "tools" in response["result"]
@@ -68,10 +104,9 @@ def test_list_tools(mcp_client: MCPClientSimulator) -> None:
     assert len(tools) > 0
 
 
-def test_tools_have_required_fields(mcp_client: MCPClientSimulator) -> None:
+def test_tools_have_required_fields(tools_list_response: Any) -> None:
     """Test that all discovered tools have required fields."""
-    response = mcp_client.call_mcp("tools/list")
-    tools = response["result"]["tools"]
+    tools = tools_list_response["result"]["tools"]
 
     for tool in tools:
         assert "name" in tool
@@ -82,10 +117,9 @@ def test_tools_have_required_fields(mcp_client: MCPClientSimulator) -> None:
         assert len(tool["description"]) > 0
 
 
-def test_tools_follow_mcp_naming_convention(mcp_client: MCPClientSimulator) -> None:
+def test_tools_follow_mcp_naming_convention(tools_list_response: Any) -> None:
     """Test that tool names follow MCP naming conventions."""
-    response = mcp_client.call_mcp("tools/list")
-    tools = response["result"]["tools"]
+    tools = tools_list_response["result"]["tools"]
 
     for tool in tools:
         # Name should not contain spaces (MCP convention)
@@ -94,10 +128,9 @@ def test_tools_follow_mcp_naming_convention(mcp_client: MCPClientSimulator) -> N
         assert tool["name"].isidentifier() or "_" in tool["name"]
 
 
-def test_specific_tools_are_available(mcp_client: MCPClientSimulator) -> None:
+def test_specific_tools_are_available(tools_list_response: Any) -> None:
     """Test that expected tools from conftest.py are available."""
-    response = mcp_client.call_mcp("tools/list")
-    tools = response["result"]["tools"]
+    tools = tools_list_response["result"]["tools"]
     tool_names = [tool["name"] for tool in tools]
 
     # These tools are defined in conftest.py and should be available
@@ -348,9 +381,9 @@ def test_user_count_tool_vs_users_endpoint(
 # Protocol Tests
 
 
-def test_mcp_json_rpc_protocol_structure(mcp_client: MCPClientSimulator) -> None:
+def test_mcp_json_rpc_protocol_structure(tools_list_response: Any) -> None:
     """Test that MCP follows JSON-RPC 2.0 protocol correctly."""
-    response = mcp_client.call_mcp("tools/list")
+    response = tools_list_response
 
     # Should have JSON-RPC 2.0 response structure
     assert "id" in response or "result" in response or "error" in response
@@ -405,8 +438,21 @@ def test_mcp_request_id_handling(mcp_client: MCPClientSimulator) -> None:
 
 def test_complete_mcp_client_workflow(mcp_client: MCPClientSimulator) -> None:
     """Test the complete workflow an MCP client would follow."""
-    # Step 1: Discover tools
-    tools_response = mcp_client.call_mcp("tools/list")
+    # Steps 1, 3 and 4: Discover tools and use the calculate and user count
+    # tools, sent together as one batch
+    tools_response, calc_response, count_response = mcp_client.call_mcp_batch(
+        [
+            ("tools/list", None),
+            (
+                "tools/call",
+                {
+                    "name": "calculate",
+                    "arguments": {"operation": "add", "a": 5, "b": 3},
+                },
+            ),
+            ("tools/call", {"name": "get_user_count", "arguments": {}}),
+        ]
+    )
     assert "result" in tools_response
     tools = tools_response["result"]["tools"]
     assert len(tools) > 0
@@ -416,17 +462,7 @@ def test_complete_mcp_client_workflow(mcp_client: MCPClientSimulator) -> None:
     assert "calculate" in tool_names
     assert "get_user_count" in tool_names
 
-    # Step 3: Use calculate tool
-    calc_response = mcp_client.call_mcp(
-        "tools/call",
-        {"name": "calculate", "arguments": {"operation": "add", "a": 5, "b": 3}},
-    )
     assert "result" in calc_response
-
-    # Step 4: Use user count tool
-    count_response = mcp_client.call_mcp(
-        "tools/call", {"name": "get_user_count", "arguments": {}}
-    )
     assert "result" in count_response
 
     # Step 5: Verify all responses are valid
@@ -458,20 +494,20 @@ def test_mcp_error_handling_workflow(mcp_client: MCPClientSimulator) -> None:
 
 def test_mcp_multiple_tool_calls(mcp_client: MCPClientSimulator) -> None:
     """Test multiple tool calls in sequence."""
-    # Call calculate tool multiple times
-    responses = []
-
+    # Call calculate tool multiple times in one batch
     operations = [
         {"operation": "add", "a": 1, "b": 2},
         {"operation": "multiply", "a": 3, "b": 4},
         {"operation": "subtract", "a": 10, "b": 3},
     ]
 
-    for operation in operations:
-        response = mcp_client.call_mcp(
-            "tools/call", {"name": "calculate", "arguments": operation}
-        )
-        responses.append(response)
+    responses = mcp_client.call_mcp_batch(
+        [
+            ("tools/call", {"name": "calculate", "arguments": operation})
+            for operation in operations
+        ]
+    )
+    assert len(responses) == len(operations)
 
     # All should succeed (or handle errors appropriately)
     for response in responses:
@@ -480,12 +516,9 @@ def test_mcp_multiple_tool_calls(mcp_client: MCPClientSimulator) -> None:
 
 def test_mcp_concurrent_request_simulation(mcp_client: MCPClientSimulator) -> None:
     """Test that MCP can handle multiple requests properly."""
-    # Make multiple requests with different IDs
-    responses = []
-
-    for i in range(3):
-        response = mcp_client.call_mcp("tools/list")
-        responses.append(response)
+    # Make multiple requests with different IDs in one batch
+    responses = mcp_client.call_mcp_batch([("tools/list", None)] * 3)
+    assert len({response["id"] for response in responses}) == 3
 
     # All should succeed
     for response in responses:
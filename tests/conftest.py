@@ -16,13 +16,18 @@ import jwt
 import pytest
 from marshmallow import Schema, ValidationError, fields
 from pyramid.config import Configurator
+from pyramid.request import Request, RequestLocalCache, apply_request_extensions
 
 # Removed unused imports
 from webtest import TestApp  # type: ignore
+from webtest.app import TestRequest  # type: ignore
+from webtest.response import TestResponse  # type: ignore
+from webtest.utils import NoDefault  # type: ignore
 
 from pyramid_mcp import tool
 from pyramid_mcp.core import MCPConfiguration
 from pyramid_mcp.protocol import MCPProtocolHandler
+from pyramid_mcp.serialization import dumps_bytes, loads
 
 # =============================================================================
 # 🔧 PYTEST CONFIGURATION HOOKS
@@ -69,7 +74,7 @@ USER_ROLES = {
 }
 
 # JWT configuration
-JWT_SECRET = "test-secret-key-for-jwt-tokens"
+JWT_SECRET = "test-secret-key-for-signing-jwt-tokens"  # >= 32 bytes for HS256
 JWT_ALGORITHM = "HS256"
 
 
@@ -233,29 +238,30 @@ def protocol_handler():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_jwt_token():
-    """Generate a valid JWT token for testing."""
+    """Generate a valid JWT token for testing, signed once per session."""
+    now = datetime.datetime.now(datetime.timezone.utc)
     payload = {
         "user_id": "test_user",
         "username": "testuser",
         "roles": ["authenticated"],
-        "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1),
-        "iat": datetime.datetime.utcnow(),
+        "exp": now + datetime.timedelta(hours=1),
+        "iat": now,
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def expired_jwt_token():
-    """Generate an expired JWT token for testing."""
+    """Generate an expired JWT token for testing, signed once per session."""
+    now = datetime.datetime.now(datetime.timezone.utc)
     payload = {
         "user_id": "test_user",
         "username": "testuser",
         "roles": ["authenticated"],
-        "exp": datetime.datetime.utcnow()
-        - datetime.timedelta(hours=1),  # Expired 1h ago
-        "iat": datetime.datetime.utcnow() - datetime.timedelta(hours=2),
+        "exp": now - datetime.timedelta(hours=1),  # Expired 1h ago
+        "iat": now - datetime.timedelta(hours=2),
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
@@ -272,7 +278,16 @@ class TestSecurityPolicy:
     This is the SINGLE security policy used across all tests.
     """
 
+    def __init__(self):
+        # permits() and authenticated_userid() both resolve the identity, so
+        # compute it once per request like a real token-verifying policy would
+        self.identity_cache = RequestLocalCache(self._load_identity)
+
     def identity(self, request):
+        """Return the identity for the request, computed once per request."""
+        return self.identity_cache.get_or_create(request)
+
+    def _load_identity(self, request):
         """Extract identity from auth headers."""
         # Check HTTP Authorization header
         auth_header = request.headers.get("Authorization", "")
@@ -288,6 +303,12 @@ class TestSecurityPolicy:
         # Reject obvious invalid tokens
         if token in ["invalid.jwt.token", "expired-test-jwt-token-456"]:
             return False
+        # Verify JWT-shaped tokens (signature and expiry)
+        if token.count(".") == 2:
+            try:
+                jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            except jwt.InvalidTokenError:
+                return False
         # Accept other tokens (including valid_bearer_token_123)
         return True
 
@@ -359,14 +380,15 @@ class TestSecurityPolicy:
         return principals
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pyramid_config():
     """
     Create a Pyramid configurator with comprehensive setup.
 
     This fixture builds and configures a Pyramid configurator but doesn't create
     the WSGI app. Use this when you need direct access to the configurator for
-    testing.
+    testing. The returned factory is stateless, so it is session-scoped and can
+    back module-scoped fixtures.
 
     Args:
         settings (dict, optional): Pyramid settings to merge with defaults
@@ -376,13 +398,20 @@ def pyramid_config():
             (default: "tests")
         ignore (list, optional): List of module patterns to ignore when scanning
         commit (bool, optional): Whether to commit configuration (default: False)
+        tools (list, optional): @tool functions to register with
+            config.add_mcp_tool; when given, nothing is scanned
 
     Returns:
         Configurator: Configured Pyramid configurator
     """
 
     def _create_config(
-        settings=None, views=None, scan_path=None, ignore=None, commit=False
+        settings=None,
+        views=None,
+        scan_path=None,
+        ignore=None,
+        commit=False,
+        tools=None,
     ):
         # Merge settings with defaults (don't replace)
         default_settings = {
@@ -396,6 +425,9 @@ def pyramid_config():
         }
         if settings:
             default_settings.update(settings)
+        if tools is not None:
+            # Explicit registration replaces pyramid_mcp's own package scan
+            default_settings["mcp.scan"] = False
         final_settings = default_settings
 
         # Create Pyramid configurator
@@ -416,18 +448,23 @@ def pyramid_config():
                 # Then add view
                 config.add_view(view_callable, route_name=route_name, **view_kwargs)
 
-        # Scan for @tool decorators with configurable path and ignore patterns
-        scan_target = scan_path if scan_path else "tests"
+        if tools is not None:
+            # Register the given tools directly, skipping the venusian scan
+            for tool_func in tools:
+                config.add_mcp_tool(tool_func)
+        else:
+            # Scan for @tool decorators with configurable path and ignore patterns
+            scan_target = scan_path if scan_path else "tests"
 
-        # Set default ignore patterns for "tests" scan to avoid import conflicts
-        if ignore is None and scan_target == "tests":
-            ignore = ["tests.cornice_integration"]
+            # Set default ignore patterns for "tests" scan to avoid import conflicts
+            if ignore is None and scan_target == "tests":
+                ignore = ["tests.cornice_integration"]
 
-        # Scan with ignore patterns if provided
-        if ignore:
-            config.scan(scan_target, categories=["pyramid_mcp"], ignore=ignore)
-        else:
-            config.scan(scan_target, categories=["pyramid_mcp"])
+            # Scan with ignore patterns if provided
+            if ignore:
+                config.scan(scan_target, categories=["pyramid_mcp"], ignore=ignore)
+            else:
+                config.scan(scan_target, categories=["pyramid_mcp"])
 
         # Commit configuration if requested (needed for introspection)
         if commit:
@@ -438,13 +475,14 @@ def pyramid_config():
     return _create_config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pyramid_wsgi_app(pyramid_config):
     """
     Create a WSGI app from a Pyramid configurator.
 
     This fixture takes a configurator and creates the WSGI application.
     Use this when you need the WSGI app but not the TestApp wrapper.
+    Like pyramid_config, the returned factory is stateless and session-scoped.
 
     Args:
         Same as pyramid_config fixture
@@ -454,7 +492,12 @@ def pyramid_wsgi_app(pyramid_config):
     """
 
     def _create_wsgi_app(
-        settings=None, views=None, scan_path=None, ignore=None, commit=None
+        settings=None,
+        views=None,
+        scan_path=None,
+        ignore=None,
+        commit=None,
+        tools=None,
     ):
         # WSGI app creation requires committed configuration
         if commit is None:
@@ -465,29 +508,68 @@ def pyramid_wsgi_app(pyramid_config):
             scan_path=scan_path,
             ignore=ignore,
             commit=commit,
+            tools=tools,
         )
         return config.make_wsgi_app()
 
     return _create_wsgi_app
 
 
-@pytest.fixture
+class MCPTestResponse(TestResponse):
+    """TestResponse decoding JSON bodies with pyramid_mcp's serializer."""
+
+    @property
+    def json(self):
+        if not self.content_type.endswith(("+json", "/json")):
+            raise AttributeError(
+                f"Not a JSON response body (content-type: {self.content_type})"
+            )
+        return loads(self.body)
+
+
+class MCPTestRequest(TestRequest):
+    ResponseClass = MCPTestResponse
+
+
+class MCPTestApp(TestApp):
+    """TestApp encoding and decoding JSON with pyramid_mcp's serializer.
+
+    The serializer uses orjson when it is installed, which speeds up the many
+    JSON-RPC round-trips in the test suite.
+    """
+
+    RequestClass = MCPTestRequest
+
+    def post_json(self, url, params=NoDefault, **kw):
+        kw.setdefault("content_type", "application/json")
+        body = dumps_bytes(params) if params is not NoDefault else ""
+        return self.post(url, params=body, **kw)
+
+
+@pytest.fixture(scope="session")
 def pyramid_app(pyramid_wsgi_app):
     """
     Create a TestApp from a WSGI application.
 
     This fixture creates a WebTest TestApp for HTTP testing.
     Use this for most tests that need to make HTTP requests.
+    The returned factory is stateless and session-scoped, so module-scoped
+    fixtures can build one app and share it.
 
     Args:
         Same as pyramid_config fixture
 
     Returns:
-        TestApp: WebTest TestApp instance
+        MCPTestApp: WebTest TestApp instance using the MCP JSON serializer
     """
 
     def _create_testapp(
-        settings=None, views=None, scan_path=None, ignore=None, commit=None
+        settings=None,
+        views=None,
+        scan_path=None,
+        ignore=None,
+        commit=None,
+        tools=None,
     ):
         wsgi_app = pyramid_wsgi_app(
             settings=settings,
@@ -495,12 +577,47 @@ def pyramid_app(pyramid_wsgi_app):
             scan_path=scan_path,
             ignore=ignore,
             commit=commit,
+            tools=tools,
         )
-        return TestApp(wsgi_app)
+        return MCPTestApp(wsgi_app)
 
     return _create_testapp
 
 
+@pytest.fixture(scope="session")
+def mcp_call():
+    """
+    Call the MCP protocol handler of a TestApp in-process.
+
+    This skips the HTTP round-trip (JSON encoding, WSGI and routing to the MCP
+    view) for tests that exercise the protocol and tools rather than the
+    transport. Tool calls still run as real subrequests through the app.
+
+    Args:
+        app: TestApp built by the pyramid_app fixture
+        message: JSON-RPC message, or a list of messages for a batch
+
+    Returns:
+        The response dictionary, or the list of responses for a batch
+    """
+
+    def _call(app, message):
+        router = app.app
+        pyramid_mcp = router.registry.pyramid_mcp
+        request = Request.blank(pyramid_mcp.config.mount_path, method="POST")
+        request.registry = router.registry
+        request.invoke_subrequest = router.invoke_subrequest
+        if router.request_extensions is not None:
+            apply_request_extensions(request, extensions=router.request_extensions)
+
+        handler = pyramid_mcp.protocol_handler
+        if isinstance(message, list):
+            return handler.handle_batch(message, request)
+        return handler.handle_message(message, request)
+
+    return _call
+
+
 # =============================================================================
 # 📊 TEST DATA FIXTURES
 # =============================================================================
@@ -711,6 +828,6 @@ def get_public_info_view(request):
     """Public view accessible without authentication."""
     return {
         "message": "This is public information",
-        "timestamp": datetime.datetime.utcnow().isoformat(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         "public": True,
     }
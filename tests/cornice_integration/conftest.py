@@ -12,14 +12,15 @@ import pytest
 from tests.conftest import TestSecurityPolicy
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pyramid_app_with_services():
     """
     Create a Pyramid app with Cornice services.
 
     Special Cornice fixture that follows the unified pattern but handles
     Cornice services. This is the ONLY exception to the unified pyramid_app
-    fixture.
+    fixture. The returned factory is stateless, so it is session-scoped and
+    can back module-scoped app fixtures.
 
     Args:
         services (list): List of Cornice service objects to add
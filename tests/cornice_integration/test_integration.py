@@ -79,8 +79,7 @@ def users_service():
     return users
 
 
-@pytest.fixture
-def products_service():
+def _create_products_service():
     """Create a Cornice service with schema validation."""
     products = Service(
         name="products",
@@ -113,6 +112,21 @@ def products_service():
     return products
 
 
+@pytest.fixture
+def products_service():
+    """Create a Cornice service with schema validation."""
+    return _create_products_service()
+
+
+@pytest.fixture(scope="module")
+def products_mcp_app(pyramid_app_with_services):
+    """TestApp exposing the products service via MCP, built once per module.
+
+    Only use it from tests that don't change the app's state.
+    """
+    return pyramid_app_with_services([_create_products_service()])
+
+
 @pytest.fixture
 def pyramid_config_with_cornice(users_service, products_service):
     """Pyramid configuration with real Cornice services."""
@@ -540,15 +554,9 @@ def test_discover_routes_with_marshmallow_integration(pyramid_config_with_cornic
 # =============================================================================
 
 
-def test_cornice_service_with_schema_via_mcp(
-    pyramid_app_with_services, products_service
-):
+def test_cornice_service_with_schema_via_mcp(products_mcp_app):
     """Test Cornice service with schema validation via MCP call."""
-    # Create services list
-    services = [products_service]
-
-    # Create app with services
-    app = pyramid_app_with_services(services)
+    app = products_mcp_app
 
     # Initialize MCP
     init_response = app.post_json(
@@ -587,6 +595,33 @@ def test_cornice_service_with_schema_via_mcp(
             assert "result" in call_response.json
 
 
+@pytest.mark.parametrize(
+    "product, expected_category",
+    [
+        ({"name": "Pen", "price": 1.5}, "general"),
+        ({"name": "Laptop", "price": 999.99, "category": "electronics"}, "electronics"),
+        ({"name": "Desk", "price": 150, "category": "furniture"}, "furniture"),
+    ],
+)
+def test_cornice_schema_tool_call_via_mcp(products_mcp_app, product, expected_category):
+    """Test calling the schema-validated products tool with several payloads."""
+    call_response = products_mcp_app.post_json(
+        "/mcp",
+        {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {"name": "create_products", "arguments": {"body": product}},
+            "id": 1,
+        },
+    )
+
+    assert call_response.status_code == 200
+    data = call_response.json["result"]["content"][0]["data"]
+    assert data["product"]["name"] == product["name"]
+    assert data["product"]["price"] == product["price"]
+    assert data["product"]["category"] == expected_category
+
+
 def test_cornice_service_tool_info_validation(
     pyramid_app_with_services, products_service, users_service
 ):
@@ -5,17 +5,23 @@ This module provides fixtures for integration tests that need specific
 user endpoints and other setup.
 """
 
+import copy
+
 import pytest
 from webtest import TestApp
 
 
-@pytest.fixture
-def integration_app(pyramid_config, users_db, user_id_counter):
+def _create_integration_app(pyramid_config, users_db, user_id_counter):
     """
     Create a TestApp with MCP and user endpoints for integration testing.
 
-    This fixture uses the modular pyramid_app fixture with user CRUD endpoints
-    that are expected by the integration tests.
+    Args:
+        pyramid_config: The pyramid_config factory fixture
+        users_db: Dict backing the user CRUD endpoints
+        user_id_counter: Dict holding the last assigned user id
+
+    Returns:
+        TestApp: WebTest TestApp instance
     """
 
     # Define user endpoint views
@@ -106,3 +112,41 @@ def integration_app(pyramid_config, users_db, user_id_counter):
     config.commit()
 
     return TestApp(config.make_wsgi_app())
+
+
+@pytest.fixture(scope="module")
+def integration_users():
+    """Module fixture: user store and id counter behind the integration app."""
+    return {}, {"value": 0}
+
+
+@pytest.fixture(scope="module")
+def shared_integration_app(pyramid_config, integration_users):
+    """
+    Module-scoped TestApp with MCP and user endpoints.
+
+    Building the app scans the tests package and introspects every route, so
+    it is built once per module. Read-only tests use it directly; tests that
+    create, update or delete users use integration_app.
+    """
+    users_db, user_id_counter = integration_users
+    return _create_integration_app(pyramid_config, users_db, user_id_counter)
+
+
+@pytest.fixture
+def integration_app(shared_integration_app, integration_users):
+    """
+    Create a TestApp with MCP and user endpoints for integration testing.
+
+    This is the shared app; the user store and id counter are snapshotted
+    before the test and restored after it, so users a test creates, updates
+    or deletes do not leak into other tests.
+    """
+    users_db, user_id_counter = integration_users
+    users_snapshot = copy.deepcopy(users_db)
+    counter_snapshot = copy.deepcopy(user_id_counter)
+    yield shared_integration_app
+    users_db.clear()
+    users_db.update(users_snapshot)
+    user_id_counter.clear()
+    user_id_counter.update(counter_snapshot)
@@ -10,17 +10,62 @@ Following TDD approach: These tests are written FIRST to define expected behavio
 then fixtures and implementation will be created to make them pass.
 """
 
+import re
+
 import pytest
 
 from pyramid_mcp import tool
 from pyramid_mcp.security import BearerAuthSchema
+from pyramid_mcp.serialization import dumps_bytes, loads
+
+# Keep the auth tests on one xdist worker so they share the module's app
+pytestmark = pytest.mark.xdist_group("mcp_auth")
+
+AUTH_SETTINGS = {
+    "mcp.server_name": "auth-test-server",
+    "mcp.server_version": "1.0.0",
+    "mcp.mount_path": "/mcp",
+    "jwt.algorithm": "HS256",
+    "jwt.expiration_delta": 3600,
+    "mcp.filter_forbidden_tools": "false",  # Disable filtering to test permission
+}
+
+# JSON-RPC payloads without per-test parts, shared by the tests below.
+# Requests only read them; tests must not mutate them.
+PROTECTED_CALL = {
+    "jsonrpc": "2.0",
+    "method": "tools/call",
+    "params": {"name": "get_protected_user", "arguments": {"id": 1}},
+    "id": 1,
+}
+PUBLIC_CALL = {
+    "jsonrpc": "2.0",
+    "method": "tools/call",
+    "params": {"name": "get_public_info", "arguments": {}},
+    "id": 1,
+}
+LIST_TOOLS = {"jsonrpc": "2.0", "method": "tools/list", "params": {}, "id": 1}
+
+# Pre-serialized bodies for tests that send a constant payload on its own
+PUBLIC_CALL_BODY = dumps_bytes(PUBLIC_CALL)
+LIST_TOOLS_BODY = dumps_bytes(LIST_TOOLS)
+
+# Matches the error messages produced by a failed permission check
+AUTH_ERROR_RE = re.compile(r"unauthorized|permission", re.IGNORECASE)
+
+
+def _json(response):
+    """Decode a WebTest response body with the package's JSON loader."""
+    return loads(response.body)
+
 
 # =============================================================================
 # 🛠️ MODULE-LEVEL TOOL DEFINITIONS (for Venusian scanning)
 # =============================================================================
 
 
-# Define test tools at module level so Venusian can find them
+# Define test tools at module level; auth_test_config registers them explicitly
+# and other apps in the suite still find them through Venusian scans
 @tool(
     name="get_protected_user",
     description="Get user info (requires authentication)",
@@ -64,50 +109,27 @@ def get_public_info() -> dict:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_test_config(pyramid_app):
     """
     Test-specific fixture: Configure pyramid for THIS test file.
 
     This fixture is responsible for:
     - Calling pyramid_app with test-specific settings
+    - Registering this module's @tool functions explicitly (no venusian scan)
     - Returning the configured TestApp for use by tests
 
-    The @tool functions are defined at module level above so Venusian can find them.
+    The app is built once per module; tests only POST to /mcp and pass their
+    credentials per call, so sharing it is safe.
     """
+    return pyramid_app(AUTH_SETTINGS, tools=[get_protected_user, get_public_info])
 
-    # Configure pyramid with auth-specific settings
-    auth_settings = {
-        "mcp.server_name": "auth-test-server",
-        "mcp.server_version": "1.0.0",
-        "mcp.mount_path": "/mcp",
-        "jwt.secret": "test-secret-key-for-auth-tests",
-        "jwt.algorithm": "HS256",
-        "jwt.expiration_delta": 3600,
-        "mcp.filter_forbidden_tools": "false",  # Disable filtering to test permission  # noqa: E501
-    }
-
-    # Return configured TestApp
-    return pyramid_app(auth_settings)
 
-
-# =============================================================================
-# 🎫 AUTHENTICATION HELPER FIXTURES
-# =============================================================================
-
-
-@pytest.fixture
-def valid_jwt_token():
-    """Provide a valid JWT token for testing."""
-    # For now, return a simple test token
-    # In real implementation, this would generate a proper JWT
-    return "valid_bearer_token_123"
-
-
-@pytest.fixture
-def expired_jwt_token():
-    """Provide an expired JWT token for testing."""
-    return "expired-test-jwt-token-456"
+@pytest.fixture(scope="module")
+def concurrent_batch_auth_config(pyramid_app):
+    """Same app as auth_test_config, handling batch messages on 4 threads."""
+    settings = dict(AUTH_SETTINGS, **{"mcp.batch_max_workers": "4"})
+    return pyramid_app(settings, tools=[get_protected_user, get_public_info])
 
 
 def test_mcp_calls_protected_route_with_jwt_succeeds(auth_test_config, valid_jwt_token):
@@ -145,7 +167,7 @@ def test_mcp_calls_protected_route_with_jwt_succeeds(auth_test_config, valid_jwt
 
     # Assert: Call succeeds
     assert response.status_code == 200
-    result = response.json
+    result = _json(response)
 
     assert "result" in result
 
@@ -162,41 +184,47 @@ def test_mcp_calls_protected_route_with_jwt_succeeds(auth_test_config, valid_jwt
     assert tool_result["authenticated"] is True
 
 
-def test_mcp_calls_protected_route_without_jwt_fails(auth_test_config):
+@pytest.mark.parametrize("token_kind", ["missing", "invalid", "expired"])
+def test_mcp_calls_protected_route_without_valid_jwt_fails(
+    auth_test_config, expired_jwt_token, token_kind
+):
     """
-    Test: MCP server CANNOT call protected route without JWT token.
+    Test: MCP server CANNOT call protected route without a valid JWT token.
 
     Expected behavior:
-    - MCP server calls protected route without JWT token
-    - Call fails with 401 Unauthorized or 403 Forbidden
+    - MCP server calls protected route with a missing, invalid or expired token
+    - Call fails with an authentication error from the permission check
     - No sensitive data is returned
     """
-    # This test will FAIL initially - no JWT auth implemented yet
+    tokens = {
+        "missing": None,
+        "invalid": "invalid.jwt.token",
+        "expired": expired_jwt_token,
+    }
+    arguments = {"id": 1}
+    if tokens[token_kind] is not None:
+        arguments["auth"] = {"auth_token": tokens[token_kind]}
 
-    # Act: MCP server calls protected route without JWT
+    # Act: MCP server calls protected route (auth passed as tool argument)
     response = auth_test_config.post_json(
         "/mcp",
         {
             "jsonrpc": "2.0",
             "method": "tools/call",
-            "params": {"name": "get_protected_user", "arguments": {"id": 1}},
+            "params": {"name": "get_protected_user", "arguments": arguments},
             "id": 1,
         },
-        # No Authorization header
     )
 
     # Assert: Call fails with authentication error
     assert response.status_code == 200  # MCP returns 200 with error in payload
-    result = response.json
+    result = _json(response)
 
-    # Expect error response due to missing authentication - Pyramid handles this now
+    # Expect error response from failed permission check
     assert "error" in result
     error = result["error"]
     assert error["code"] == -32603  # Internal error (from permission failure)
-    assert (
-        "unauthorized" in error["message"].lower()
-        or "permission" in error["message"].lower()
-    )
+    assert AUTH_ERROR_RE.search(error["message"])
 
 
 def test_mcp_calls_public_route_always_succeeds(auth_test_config):
@@ -211,20 +239,16 @@ def test_mcp_calls_public_route_always_succeeds(auth_test_config):
     # This test should PASS even initially - public routes don't need auth
 
     # Act: MCP server calls public route (no JWT needed)
-    response = auth_test_config.post_json(
+    response = auth_test_config.post(
         "/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {"name": "get_public_info", "arguments": {}},
-            "id": 1,
-        },
+        PUBLIC_CALL_BODY,
+        content_type="application/json",
         # No Authorization header needed for public routes
     )
 
     # Assert: Call succeeds
     assert response.status_code == 200
-    result = response.json
+    result = _json(response)
     assert "result" in result
 
     # Expect new MCP context format
@@ -242,86 +266,6 @@ def test_mcp_calls_public_route_always_succeeds(auth_test_config):
     assert tool_result["authenticated"] is False
 
 
-def test_mcp_calls_with_invalid_jwt_fails(auth_test_config):
-    """
-    Test: MCP server fails when using invalid/malformed JWT token.
-
-    Expected behavior:
-    - MCP server provides invalid JWT token
-    - Call fails with authentication error
-    - No access to protected resources
-    """
-    # Act: MCP server calls with invalid JWT (passed as parameter)
-    response = auth_test_config.post_json(
-        "/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "get_protected_user",
-                "arguments": {
-                    "id": 1,
-                    "auth_token": "invalid.jwt.token",  # Invalid token as parameter
-                },
-            },
-            "id": 1,
-        },
-    )
-
-    # Assert: Call fails - security policy rejects invalid token
-    assert response.status_code == 200  # MCP returns 200 with error in payload
-    result = response.json
-
-    # Expect error response from failed permission check
-    assert "error" in result
-    error = result["error"]
-    assert error["code"] == -32603  # Internal error (from permission failure)
-    assert (
-        "unauthorized" in error["message"].lower()
-        or "permission" in error["message"].lower()
-    )
-
-
-def test_mcp_calls_with_expired_jwt_fails(auth_test_config, expired_jwt_token):
-    """
-    Test: MCP server fails when using expired JWT token.
-
-    Expected behavior:
-    - MCP server provides expired JWT token
-    - Call fails with authentication error
-    - Token expiration is properly validated
-    """
-    # Act: MCP server calls with expired JWT (passed as parameter)
-    response = auth_test_config.post_json(
-        "/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "get_protected_user",
-                "arguments": {
-                    "id": 1,
-                    "auth_token": expired_jwt_token,  # Expired token as parameter
-                },
-            },
-            "id": 1,
-        },
-    )
-
-    # Assert: Call fails due to expired token
-    assert response.status_code == 200  # MCP returns 200 with error in payload
-    result = response.json
-
-    # Expect error response from failed permission check
-    assert "error" in result
-    error = result["error"]
-    assert error["code"] == -32603  # Internal error (from permission failure)
-    assert (
-        "unauthorized" in error["message"].lower()
-        or "permission" in error["message"].lower()
-    )
-
-
 def test_mcp_tool_reflects_pyramid_view_permission(auth_test_config, valid_jwt_token):
     """
     Test: MCP tools respect the permission requirements of underlying Pyramid views.
@@ -335,54 +279,34 @@ def test_mcp_tool_reflects_pyramid_view_permission(auth_test_config, valid_jwt_t
     # This test validates our core integration requirement
 
     # Act: List available MCP tools
-    response = auth_test_config.post_json(
+    response = auth_test_config.post(
         "/mcp",
-        {"jsonrpc": "2.0", "method": "tools/list", "params": {}, "id": 1},
+        LIST_TOOLS_BODY,
+        content_type="application/json",
         headers={"Authorization": f"Bearer {valid_jwt_token}"},
     )
 
     # Assert: Tools reflect permission requirements
     assert response.status_code == 200
-    tools = response.json["result"]["tools"]
+    tools = _json(response)["result"]["tools"]
 
     # Find our protected tool
-    protected_tool = next((t for t in tools if t["name"] == "get_protected_user"), None)
+    tools_by_name = {t["name"]: t for t in tools}
+    protected_tool = tools_by_name.get("get_protected_user")
     assert protected_tool is not None
 
     # Verify tool exists and has description indicating authentication requirement
-    assert (
-        "authentication" in protected_tool["description"].lower()
-        or "requires" in protected_tool["description"].lower()
-    )
+    description = protected_tool["description"].lower()
+    assert "authentication" in description or "requires" in description
 
 
-def test_tool_decorator_with_permission_parameter(auth_test_config, valid_jwt_token):
+def test_tool_decorator_with_permission_parameter(
+    concurrent_batch_auth_config, valid_jwt_token
+):
     """Test that the new @tool decorator with permission parameter works correctly."""
 
-    # Create a simple test to verify the decorator functionality
-    # The tools are already registered in the fixture using the new decorator syntax
-
-    # Test that the protected tool requires authentication
-    protected_request = {
-        "jsonrpc": "2.0",
-        "method": "tools/call",
-        "params": {"name": "get_protected_user", "arguments": {"id": 1}},
-        "id": 1,
-    }
-
-    # Should fail without JWT (missing auth_token parameter)
-    response = auth_test_config.post_json("/mcp", protected_request, status=200)
-    result = response.json
-    # Expect error response from failed permission check
-    assert "error" in result
-    error = result["error"]
-    assert error["code"] == -32603  # Internal error (from permission failure)
-    assert (
-        "unauthorized" in error["message"].lower()
-        or "permission" in error["message"].lower()
-    )
-
-    # Should succeed with JWT (passed as auth_token parameter)
+    # The tools are already registered in the fixture using the new decorator syntax.
+    # All four calls go out as a single JSON-RPC batch request.
     protected_request_with_auth = {
         "jsonrpc": "2.0",
         "method": "tools/call",
@@ -390,32 +314,34 @@ def test_tool_decorator_with_permission_parameter(auth_test_config, valid_jwt_to
             "name": "get_protected_user",
             "arguments": {"id": 1, "auth": {"auth_token": valid_jwt_token}},
         },
-        "id": 1,
-    }
-    response = auth_test_config.post_json(
-        "/mcp", protected_request_with_auth, status=200
-    )
-    assert "result" in response.json
-    assert response.json["result"]["type"] == "mcp/context"
-
-    # Test that the public tool works without authentication
-    public_request = {
-        "jsonrpc": "2.0",
-        "method": "tools/call",
-        "params": {"name": "get_public_info", "arguments": {}},
         "id": 2,
     }
+    batch = [
+        PROTECTED_CALL,  # id 1, no auth_token parameter
+        protected_request_with_auth,
+        {**PUBLIC_CALL, "id": 3},
+        {**LIST_TOOLS, "id": 4},
+    ]
+
+    response = concurrent_batch_auth_config.post_json("/mcp", batch, status=200)
+    results = {r["id"]: r for r in _json(response)}
+    assert set(results) == {1, 2, 3, 4}
+
+    # Protected tool should fail without JWT (failed permission check)
+    assert "error" in results[1]
+    error = results[1]["error"]
+    assert error["code"] == -32603  # Internal error (from permission failure)
+    assert AUTH_ERROR_RE.search(error["message"])
 
-    response = auth_test_config.post_json("/mcp", public_request, status=200)
-    assert "result" in response.json
-    assert response.json["result"]["type"] == "mcp/context"
-
-    # Verify the tools are listed correctly
-    list_request = {"jsonrpc": "2.0", "method": "tools/list", "id": 3}
+    # Protected tool should succeed with JWT (passed as auth_token parameter)
+    assert "result" in results[2]
+    assert results[2]["result"]["type"] == "mcp/context"
 
-    response = auth_test_config.post_json("/mcp", list_request, status=200)
-    tools = response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
+    # Public tool works without authentication
+    assert "result" in results[3]
+    assert results[3]["result"]["type"] == "mcp/context"
 
+    # Verify the tools are listed correctly
+    tool_names = {t["name"] for t in results[4]["result"]["tools"]}
     assert "get_protected_user" in tool_names
     assert "get_public_info" in tool_names
@@ -12,19 +12,38 @@ This module tests:
 Uses enhanced fixtures from conftest.py for clean, non-duplicated test setup.
 """
 
+from collections import deque
+
 import pytest
 from pyramid.config import Configurator
 from pyramid.view import view_config
 from webtest import TestApp  # type: ignore
 
 from pyramid_mcp import tool
+from pyramid_mcp.serialization import dumps_bytes
+
+# Constant JSON-RPC requests, pre-serialized once for the HTTP-level tests
+INITIALIZE_BODY = dumps_bytes(
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {"protocolVersion": "2024-11-05", "capabilities": {}},
+    }
+)
+LIST_TOOLS_REQUEST = {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
+LIST_TOOLS_BODY = dumps_bytes(LIST_TOOLS_REQUEST)
 
 # =============================================================================
 # 🎯 REAL ROUTE CALLING INTEGRATION TESTS
 # =============================================================================
 
 
-@tool(name="manual_calculator", description="Manual calculator tool for comparison")
+@tool(
+    name="manual_calculator",
+    description="Manual calculator tool for comparison",
+    pure=True,
+)
 def calculator_tool(operation: str, a: float, b: float) -> str:
     """Manual calculator tool for testing alongside auto-discovered tools."""
     # Convert to float to handle JSON string/number conversion
@@ -39,7 +58,7 @@ def calculator_tool(operation: str, a: float, b: float) -> str:
         return f"Unknown operation: {operation}"
 
 
-@tool(name="data_analyzer", description="Analyze data from API responses")
+@tool(name="data_analyzer", description="Analyze data from API responses", pure=True)
 def data_analyzer_tool(data_type: str, analysis: str) -> str:
     """Analyze data based on type and analysis method."""
     if analysis == "describe":
@@ -50,14 +69,41 @@ def data_analyzer_tool(data_type: str, analysis: str) -> str:
         return f"Unknown analysis '{analysis}' for '{data_type}'"
 
 
+def _tool_call(request_id, name, **body):
+    """Build a tools/call request passing body arguments to the tool."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": name, "arguments": {"body": body}},
+        "id": request_id,
+    }
+
+
+def _context_text(payload):
+    """Assert an MCP context result and return the text of its first content."""
+    result = payload["result"]
+    assert result["type"] == "mcp/context"
+    assert "content" in result
+    return str(result["content"][0]["text"])
+
+
+def _call_batch(mcp_call, app, batch):
+    """Handle a JSON-RPC batch in-process and key the responses by request id."""
+    return {result["id"]: result for result in mcp_call(app, batch)}
+
+
 # =============================================================================
 # 🧪 TEST-SPECIFIC FIXTURES
 # =============================================================================
 
 
-@pytest.fixture
-def end_to_end_test_config(pyramid_app):
-    """Test-specific fixture: Configure pyramid for end-to-end integration tests."""
+@pytest.fixture(scope="module")
+def real_routes_app(pyramid_app):
+    """Module fixture: Pyramid app with route discovery mounted at /mcp.
+
+    The configuration is committed once and the TestApp is shared by every
+    test in this module that calls real views through /mcp.
+    """
 
     # Configure pyramid with end-to-end specific settings
     settings = {
@@ -71,29 +117,31 @@ def end_to_end_test_config(pyramid_app):
     return pyramid_app(settings)
 
 
-def test_auto_discovered_tools_call_real_views(end_to_end_test_config):
+@pytest.fixture(scope="module")
+def real_routes_tool_names(real_routes_app, mcp_call):
+    """Module fixture: names of the tools listed by real_routes_app.
+
+    The tool set only depends on the app configuration, so tools/list is
+    called once for the tests that just check which tools are available.
+    """
+    tools = mcp_call(real_routes_app, LIST_TOOLS_REQUEST)["result"]["tools"]
+    return frozenset(tool["name"] for tool in tools)
+
+
+def test_auto_discovered_tools_call_real_views(real_routes_app):
     """Test that auto-discovered tools call actual Pyramid views, not simulations."""
-    app = end_to_end_test_config
+    app = real_routes_app
 
     # Initialize MCP
-    mcp_init_request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {"protocolVersion": "2024-11-05", "capabilities": {}},
-    }
-
-    response = app.post_json("/mcp", mcp_init_request)
+    response = app.post("/mcp", INITIALIZE_BODY, content_type="application/json")
     assert response.status_code == 200
     assert response.json["result"]["serverInfo"]["name"] == "real-integration-server"
 
     # 3. Get list of tools
-    mcp_list_request = {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
-
-    response = app.post_json("/mcp", mcp_list_request)
+    response = app.post("/mcp", LIST_TOOLS_BODY, content_type="application/json")
     assert response.status_code == 200
     tools = response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
+    tool_names = frozenset(tool["name"] for tool in tools)
 
     # Should have both manual and potentially auto-discovered tools
     assert "manual_calculator" in tool_names
@@ -112,11 +160,10 @@ def test_auto_discovered_tools_call_real_views(end_to_end_test_config):
     response = app.post_json("/mcp", mcp_call_manual)
     assert response.status_code == 200
 
-    # Debug: Print the actual response structure
-    print("DEBUG: Full response:", response.json)
+    data = response.json
 
     # Expect new MCP context format
-    result = response.json["result"]
+    result = data["result"]
     assert result["type"] == "mcp/context"
     assert result["version"] == "1.0"
     assert "source" in result
@@ -135,8 +182,8 @@ def test_auto_discovered_tools_call_real_views(end_to_end_test_config):
 
     # 5. Test auto-discovered tools (use any available tool)
     # Test any available tool from route discovery
-    assert len(tool_names) > 0  # Ensure some tools exist
-    test_tool_name = tool_names[0]  # Use first available tool
+    assert len(tools) > 0  # Ensure some tools exist
+    test_tool_name = tools[0]["name"]  # Use first available tool
 
     mcp_call_tool = {
         "jsonrpc": "2.0",
@@ -149,41 +196,32 @@ def test_auto_discovered_tools_call_real_views(end_to_end_test_config):
     assert response.status_code == 200
 
     # Should get real JSON from the actual view in new MCP context format
-    mcp_result = response.json["result"]
-    assert mcp_result["type"] == "mcp/context"
-    result_content = mcp_result["content"][0]["text"]
-
-    # Extract result directly from content
-    result_text = str(result_content)
+    result_text = _context_text(response.json)
     # Tool should either execute successfully or return an error
     assert result_text  # Just verify we got some response
 
     # Test second available tool (if available)
-    assert len(tool_names) > 1  # Ensure we have at least 2 tools for testing
+    assert len(tools) > 1  # Ensure we have at least 2 tools for testing
 
     mcp_call_user = {
         "jsonrpc": "2.0",
         "id": 5,
         "method": "tools/call",
-        "params": {"name": tool_names[1], "arguments": {}},
+        "params": {"name": tools[1]["name"], "arguments": {}},
     }
 
     response = app.post_json("/mcp", mcp_call_user)
     assert response.status_code == 200
 
     # Extract result from new MCP context format
-    mcp_result = response.json["result"]
-    assert mcp_result["type"] == "mcp/context"
-    result_content = mcp_result["content"][0]["text"]
-
-    # Extract result directly from content
-    result_text = str(result_content)
+    result_text = _context_text(response.json)
     # Tool should either execute successfully or return an error
     assert result_text  # Just verify we got some response
 
 
-def test_comparison_simulation_vs_real():
-    """Compare simulated tool responses vs real view responses."""
+@pytest.fixture(scope="module")
+def comparison_app():
+    """Module fixture: Pyramid app with a single real test endpoint."""
     settings = {
         "mcp.server_name": "comparison-test",
         "mcp.mount_path": "/mcp",
@@ -207,26 +245,32 @@ def test_comparison_simulation_vs_real():
     config.add_view(test_view, route_name="test_endpoint", renderer="json")
     config.include("pyramid_mcp")
 
-    app = TestApp(config.make_wsgi_app())
+    return TestApp(config.make_wsgi_app())
+
+
+@pytest.mark.slow
+def test_comparison_simulation_vs_real(comparison_app):
+    """Compare simulated tool responses vs real view responses."""
+    app = comparison_app
 
     # Test direct endpoint
     direct_response = app.get("/test/endpoint")
-    assert direct_response.json["is_simulation"] is False
-    assert direct_response.json["source"] == "actual_pyramid_view"
+    direct_data = direct_response.json
+    assert direct_data["is_simulation"] is False
+    assert direct_data["source"] == "actual_pyramid_view"
 
     # Test via MCP if tools are available
-    list_request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
-    list_response = app.post_json("/mcp", list_request)  # type: ignore
+    list_response = app.post("/mcp", LIST_TOOLS_BODY, content_type="application/json")
 
     tools = list_response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
+    tool_names = frozenset(tool["name"] for tool in tools)
 
     # If auto-discovery created tools, test them
-    endpoint_tools = [
+    endpoint_tools = sorted(
         name
         for name in tool_names
-        if "test" in name.lower() or "endpoint" in name.lower()
-    ]
+        if any(word in name.lower() for word in ("test", "endpoint"))
+    )
 
     if endpoint_tools:
         call_request = {
@@ -240,12 +284,7 @@ def test_comparison_simulation_vs_real():
         assert call_response.status_code == 200
 
         # Extract result from new MCP context format
-        mcp_result = call_response.json["result"]
-        assert mcp_result["type"] == "mcp/context"
-        result_content = mcp_result["content"][0]["text"]
-
-        # Extract result directly from content
-        result_text = str(result_content)
+        result_text = _context_text(call_response.json)
         assert "false" in result_text.lower()
         assert "actual_pyramid_view" in result_text
 
@@ -255,164 +294,46 @@ def test_comparison_simulation_vs_real():
 # =============================================================================
 
 
-@pytest.fixture
-def workflow_test_config(pyramid_app):
-    """Test-specific fixture: Configure pyramid for workflow tests."""
-
-    # Configure pyramid with workflow-specific settings
-    settings = {
-        "mcp.server_name": "workflow-test-server",
-        "mcp.server_version": "1.0.0",
-        "mcp.mount_path": "/mcp",
-        "mcp.route_discovery.enabled": True,
-    }
-
-    # Return configured TestApp using the global fixture
-    return pyramid_app(settings)
-
-
-def test_complete_pyramid_mcp_workflow(workflow_test_config):
-    """Test complete workflow from tool registration to execution via HTTP."""
-    app = workflow_test_config
-
-    # 2. Test via MCP protocol
-    init_request = {"jsonrpc": "2.0", "method": "initialize", "id": 1}
-    init_response = app.post_json("/mcp", init_request)
-    assert init_response.status_code == 200
-
-    # 3. List tools - check available tools first
-    list_request = {"jsonrpc": "2.0", "method": "tools/list", "id": 2}
-    list_response = app.post_json("/mcp", list_request)
-
-    tools = list_response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
-
-    # The fixture may not include our newly registered tools
-    # So test with whatever tools are available
-    available_tools = [
-        name
-        for name in tool_names
-        if name
-        in ["workflow_calculator", "text_processor", "get_user_count", "calculate"]
-    ]
-    assert (
-        len(available_tools) > 0
-    ), f"Expected some tools to be available, got: {tool_names}"
-
-    # 4. Test available tools
-    if "workflow_calculator" in tool_names:
-        calc_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "workflow_calculator",
-                "arguments": {"body": {"operation": "sum", "values": [1, 2, 3, 4, 5]}},
-            },
-            "id": 3,
-        }
-
-        calc_response = app.post_json("/mcp", calc_request)
-        assert calc_response.status_code == 200
-
-        # Expect MCP context format
-        calc_data = calc_response.json["result"]
-        assert calc_data["type"] == "mcp/context"
-        assert "content" in calc_data
-
-        # Extract result from new structure
-        calc_result = calc_data["content"][0]["text"]
-
-        # Should contain the sum result (1+2+3+4+5 = 15)
-        assert "15" in str(calc_result)
-
-    elif "calculate" in tool_names:
-        # Use the existing calculate tool from fixtures
-        calc_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "calculate",
-                "arguments": {"body": {"operation": "add", "a": 10, "b": 5}},
-            },
-            "id": 3,
-        }
-
-        calc_response = app.post_json("/mcp", calc_request)
-        assert calc_response.status_code == 200
-
-        # Expect MCP context format
-        calc_data = calc_response.json["result"]
-        assert calc_data["type"] == "mcp/context"
-        assert "content" in calc_data
-
-        # Extract result from new structure
-        calc_result = calc_data["content"][0]["text"]
-
-        # Should contain the calculation result (10 + 5 = 15)
-        assert "15" in str(calc_result)
-
-    # 5. Test text processor or available tool
-    if "text_processor" in tool_names:
-        text_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "text_processor",
-                "arguments": {"body": {"action": "upper", "text": "hello world"}},
+def test_complete_pyramid_mcp_workflow(
+    real_routes_app, real_routes_tool_names, mcp_call
+):
+    """Test complete workflow from tool registration to execution."""
+    app = real_routes_app
+
+    # 3. Check available tools first
+    # (the initialize handshake is covered by the real views test above)
+    tool_names = real_routes_tool_names
+
+    # The tests package is scanned, so its conftest tools are always there
+    assert {"calculate", "get_user_count"} <= tool_names
+
+    # 4. Call the tools and an invalid operation in one batch
+    responses = _call_batch(
+        mcp_call,
+        app,
+        [
+            _tool_call(3, "calculate", operation="add", a=10, b=5),
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": "get_user_count", "arguments": {}},
+                "id": 4,
             },
-            "id": 4,
-        }
-
-        text_response = app.post_json("/mcp", text_request)
-        assert text_response.status_code == 200
+            _tool_call(5, "calculate", operation="invalid", a=1, b=2),
+        ],
+    )
 
-        # Extract result from new MCP context format
-        mcp_result = text_response.json["result"]
-        assert mcp_result["type"] == "mcp/context"
-        result_content = mcp_result["content"][0]["text"]
-
-        # Extract result directly from content
-        text_result = str(result_content)
-        assert "HELLO WORLD" in text_result
-
-    # Test user count tool if available
-    if "get_user_count" in tool_names:
-        # Use the existing get_user_count tool from fixtures
-        user_count_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {"name": "get_user_count", "arguments": {}},
-            "id": 4,
-        }
+    # Should contain the calculation result (10 + 5 = 15)
+    assert "15" in _context_text(responses[3])
 
-        user_count_response = app.post_json("/mcp", user_count_request)
-        assert user_count_response.status_code == 200
-        # Just verify we got a response in new MCP context format
-        result = user_count_response.json["result"]
-        assert result["type"] == "mcp/context"
-        assert "content" in result
-        assert result["content"][0]
-
-    # 6. Test error handling with available tool
-    if "calculate" in tool_names:
-        error_request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "calculate",
-                "arguments": {"body": {"operation": "invalid", "a": 1, "b": 2}},
-            },
-            "id": 5,
-        }
+    # Just verify we got a response in new MCP context format
+    assert _context_text(responses[4])
 
-        error_response = app.post_json("/mcp", error_request)
-        assert error_response.status_code == 200
-        # Should get an error for invalid operation (check nested response structure)
-        response_str = str(error_response.json)
-        assert "error" in response_str.lower()
+    # Should get an error for invalid operation (check nested response structure)
+    assert "error" in str(responses[5]).lower()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multi_step_test_config(pyramid_app):
     """Test-specific fixture: Configure pyramid for multi-step integration tests."""
 
@@ -428,105 +349,68 @@ def multi_step_test_config(pyramid_app):
     return pyramid_app(settings)
 
 
-def test_multi_step_integration_scenario(multi_step_test_config):
+def test_multi_step_integration_scenario(multi_step_test_config, mcp_call):
     """Test a complex multi-step scenario involving multiple components."""
     app = multi_step_test_config
 
-    # 4. Test the complete workflow
-
-    # Step 1: Initialize MCP
-    init_response = app.post_json(
-        "/api/mcp", {"jsonrpc": "2.0", "method": "initialize", "id": 1}
+    # 4. Test the complete workflow, sending every step in one batch request
+    responses = _call_batch(
+        mcp_call,
+        app,
+        [
+            # Step 2: Get available tools
+            {"jsonrpc": "2.0", "method": "tools/list", "id": 2},
+            # Step 3: Test manual tool
+            _tool_call(3, "data_analyzer", data_type="numbers", analysis="validate"),
+            # Step 4: Test multiple tool calls in sequence (multi-step scenario)
+            _tool_call(4, "data_analyzer", data_type="letters", analysis="describe"),
+            # Step 5: Test calculator tool as well (multi-tool scenario)
+            _tool_call(5, "manual_calculator", operation="multiply", a=6, b=7),
+        ],
     )
-    assert init_response.status_code == 200
 
-    # Step 2: Get available tools
-    list_response = app.post_json(
-        "/api/mcp", {"jsonrpc": "2.0", "method": "tools/list", "id": 2}
-    )
-    tools = list_response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
+    tool_names = frozenset(tool["name"] for tool in responses[2]["result"]["tools"])
     assert "data_analyzer" in tool_names
 
-    # Step 3: Test manual tool
-    analyze_response = app.post_json(
-        "/api/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "data_analyzer",
-                "arguments": {"body": {"data_type": "numbers", "analysis": "validate"}},
-            },
-            "id": 3,
-        },
-    )
-    assert analyze_response.status_code == 200
-
     # Expect new MCP context format
-    result_data = analyze_response.json["result"]
-    assert result_data["type"] == "mcp/context"
-    assert "content" in result_data
+    result_text = _context_text(responses[3])
+    assert "numbers" in result_text and "valid" in result_text
 
-    # Extract content from new structure
-    result_content = result_data["content"][0]["text"]
+    # Expect new MCP context format for second call
+    result2 = _context_text(responses[4])
+    assert "letters" in result2 and "describe" in result2
 
-    # Extract result directly from content
-    result_text = str(result_content)
-    assert "numbers" in result_text and "valid" in result_text
+    # Should get a result for the calculator call as well
+    assert "result" in responses[5]
 
-    # Step 4: Test multiple tool calls in sequence (multi-step scenario)
-    # Test another analysis type
-    analyze_response2 = app.post_json(
-        "/api/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "data_analyzer",
-                "arguments": {"body": {"data_type": "letters", "analysis": "describe"}},
-            },
-            "id": 4,
-        },
-    )
-    assert analyze_response2.status_code == 200
 
-    # Expect new MCP context format for second call
-    result_data2 = analyze_response2.json["result"]
-    assert result_data2["type"] == "mcp/context"
-    assert "content" in result_data2
+# =============================================================================
+# 🧪 ADVANCED TOOL REGISTRATION AND EXECUTION TESTS
+# =============================================================================
 
-    # Extract content from new structure
-    result_content2 = result_data2["content"][0]["text"]
 
-    # Extract result directly from content
-    result2 = str(result_content2)
+# Only the most recent counter operations are kept for detailed reports
+COUNTER_HISTORY_SIZE = 1024
 
-    assert "letters" in result2 and "describe" in result2
 
-    # Step 5: Test calculator tool as well (multi-tool scenario)
-    # Assume manual_calculator tool exists (test should be deterministic)
-    calc_response = app.post_json(
-        "/api/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "manual_calculator",
-                "arguments": {"body": {"operation": "multiply", "a": 6, "b": 7}},
-            },
-            "id": 5,
-        },
-    )
+def _new_counter_state(*operations):
+    """Create counter state: the total, an operation count and a bounded log.
 
-    # Should get a response (success or error)
-    assert calc_response.status_code == 200
-    assert "result" in calc_response.json
+    The log keeps (verb, value) pairs, which are only formatted into text when
+    a detailed report asks for them.
+    """
+    return {
+        "count": 0,
+        "ops": len(operations),
+        "operations": deque(operations, maxlen=COUNTER_HISTORY_SIZE),
+    }
 
 
-# =============================================================================
-# 🧪 ADVANCED TOOL REGISTRATION AND EXECUTION TESTS
-# =============================================================================
+@pytest.fixture(autouse=True)
+def reset_dynamic_counter():
+    """Start every test with an uninitialized counter, as apps are shared."""
+    if hasattr(dynamic_counter, "state"):
+        del dynamic_counter.state
 
 
 # Define counter tool at module level (following our clean pattern)
@@ -538,21 +422,21 @@ def dynamic_counter(operation: str, value: int = 1) -> str:
         value = int(value)
 
     if not hasattr(dynamic_counter, "state"):
-        dynamic_counter.state = {"count": 0, "operations": []}
+        dynamic_counter.state = _new_counter_state()
 
+    state = dynamic_counter.state
     if operation == "add":
-        dynamic_counter.state["count"] += value
-        dynamic_counter.state["operations"].append(f"added {value}")
+        state["count"] += value
+        state["ops"] += 1
+        state["operations"].append(("added", value))
     elif operation == "subtract":
-        dynamic_counter.state["count"] -= value
-        dynamic_counter.state["operations"].append(f"subtracted {value}")
+        state["count"] -= value
+        state["ops"] += 1
+        state["operations"].append(("subtracted", value))
     elif operation == "reset":
-        dynamic_counter.state = {"count": 0, "operations": ["reset"]}
+        state = dynamic_counter.state = _new_counter_state(("reset", None))
 
-    return (
-        f"Count: {dynamic_counter.state['count']}, "
-        f"Operations: {len(dynamic_counter.state['operations'])}"
-    )
+    return f"Count: {state['count']}, Operations: {state['ops']}"
 
 
 @tool(name="counter_reporter", description="Report on counter state")
@@ -561,137 +445,64 @@ def counter_reporter(report_type: str = "summary") -> str:
     if hasattr(dynamic_counter, "state"):
         state = dynamic_counter.state
         if report_type == "summary":
-            return (
-                f"Counter is at {state['count']} after "
-                f"{len(state['operations'])} operations"
-            )
+            return f"Counter is at {state['count']} after {state['ops']} operations"
         elif report_type == "detailed":
-            return (
-                f"Counter: {state['count']}, "
-                f"Operations: {', '.join(state['operations'])}"
+            operations = ", ".join(
+                verb if value is None else f"{verb} {value}"
+                for verb, value in state["operations"]
             )
+            return f"Counter: {state['count']}, Operations: {operations}"
         else:
             return f"Unknown report type: {report_type}"
     else:
         return "Counter not initialized"
 
 
-@tool(name="performance_test", description="Simulate performance testing")
+@tool(name="performance_test", description="Simulate performance testing", pure=True)
 def performance_test(iterations: int = 100, operation: str = "compute") -> str:
     """Simulate computational work."""
+    # Closed forms of sum(i * i) and sum(i) over range(iterations)
+    n = max(iterations, 0)
     result = 0
-    for i in range(iterations):
-        if operation == "compute":
-            result += i * i
-        elif operation == "sum":
-            result += i
+    if operation == "compute":
+        result = (n - 1) * n * (2 * n - 1) // 6
+    elif operation == "sum":
+        result = (n - 1) * n // 2
 
     return f"Completed {iterations} {operation} operations, result: {result}"
 
 
-@pytest.fixture
-def dynamic_test_config(pyramid_app):
-    """Test-specific fixture: Configure pyramid for dynamic tool tests."""
-
-    # Configure pyramid with dynamic tool test settings
-    settings = {
-        "mcp.server_name": "dynamic-tool-test-server",
-        "mcp.server_version": "1.0.0",
-        "mcp.mount_path": "/mcp",
-        "mcp.route_discovery.enabled": True,
-    }
-
-    # Return configured TestApp using the global fixture
-    return pyramid_app(settings)
-
-
-def test_dynamic_tool_registration_workflow(dynamic_test_config):
+def test_dynamic_tool_registration_workflow(
+    real_routes_app, real_routes_tool_names, mcp_call
+):
     """Test tool registration and execution workflow."""
-    app = dynamic_test_config
-
-    # Initialize MCP and verify tool registration
-    init_response = app.post_json(
-        "/mcp", {"jsonrpc": "2.0", "method": "initialize", "id": 1}
-    )
-    assert init_response.status_code == 200
-
-    # List tools to verify counter tool is registered
-    list_response = app.post_json(
-        "/mcp", {"jsonrpc": "2.0", "method": "tools/list", "id": 2}
-    )
-    assert list_response.status_code == 200
-    tools = list_response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
-    assert "dynamic_counter" in tool_names
-
-    # Test the counter tool via MCP protocol
-    # Test add operations
-    add_response1 = app.post_json(
-        "/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "dynamic_counter",
-                "arguments": {"body": {"operation": "add", "value": 5}},
-            },
-            "id": 3,
-        },
+    app = real_routes_app
+
+    # Verify counter tool is registered
+    assert "dynamic_counter" in real_routes_tool_names
+
+    # Batch messages are handled in order, so the counter calls build on each
+    # other and the reporter sees both of them
+    responses = _call_batch(
+        mcp_call,
+        app,
+        [
+            # Test the counter tool via MCP protocol
+            _tool_call(3, "dynamic_counter", operation="add", value=5),
+            _tool_call(4, "dynamic_counter", operation="add", value=3),
+            # 5. Test the counter_reporter tool (defined at module level)
+            _tool_call(5, "counter_reporter", report_type="summary"),
+        ],
     )
-    assert add_response1.status_code == 200
-    result1_data = add_response1.json["result"]
-    assert result1_data["type"] == "mcp/context"
-    assert "content" in result1_data
-
-    # Extract content from new structure
-    result_content = result1_data["content"][0]["text"]
-
-    # Extract result directly from content
-    result = str(result_content)
 
     # The dynamic counter add operation should succeed
-    assert "Count:" in str(result)
-
-    # Test another add operation
-    add_response2 = app.post_json(
-        "/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "dynamic_counter",
-                "arguments": {"body": {"operation": "add", "value": 3}},
-            },
-            "id": 4,
-        },
-    )
-    assert add_response2.status_code == 200
-
-    # 5. Test the counter_reporter tool via MCP protocol (now defined at module level)
-    reporter_response = app.post_json(
-        "/mcp",
-        {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "counter_reporter",
-                "arguments": {"body": {"report_type": "summary"}},
-            },
-            "id": 5,
-        },
-    )
-    assert reporter_response.status_code == 200
-
-    # Expect MCP context format
-    reporter_data = reporter_response.json["result"]
-    assert reporter_data["type"] == "mcp/context"
-    assert "content" in reporter_data
+    assert "Count: 5, Operations: 1" in _context_text(responses[3])
+    assert "Count: 8, Operations: 2" in _context_text(responses[4])
 
-    # Extract result from new structure
-    summary_result = reporter_data["content"][0]["text"]
-
-    # Should show counter operations
-    assert "operations" in str(summary_result)
+    # Should show counter operations in MCP context format
+    summary_result = _context_text(responses[5])
+    assert "operations" in summary_result
+    assert "Counter is at 8 after 2 operations" in summary_result
 
     # ✅ Dynamic tool registration workflow completed successfully!
     #
@@ -706,32 +517,26 @@ def test_dynamic_tool_registration_workflow(dynamic_test_config):
     # The core functionality is working perfectly with our proven patterns!
 
 
-def test_error_handling_across_components(integration_app):
+def test_error_handling_across_components(shared_integration_app, mcp_call):
     """Test error handling across different components in integration."""
-    # Test various error scenarios
+    # These are protocol-level errors, so the messages go straight to the
+    # protocol handler; the HTTP transport is covered by the tests above
+    app = shared_integration_app
 
     # 1. Invalid JSON-RPC request
-    invalid_response = integration_app.post_json("/mcp", {"invalid": "request"})
-    assert invalid_response.status_code == 200
-    assert "error" in invalid_response.json
+    assert "error" in mcp_call(app, {"invalid": "request"})
 
     # 2. Valid JSON-RPC but invalid method
-    invalid_method_response = integration_app.post_json(
-        "/mcp", {"jsonrpc": "2.0", "method": "invalid_method", "id": 1}
+    assert "error" in mcp_call(
+        app, {"jsonrpc": "2.0", "method": "invalid_method", "id": 1}
     )
-    assert invalid_method_response.status_code == 200
-    assert "error" in invalid_method_response.json
 
     # 3. Valid method but missing parameters
-    missing_params_response = integration_app.post_json(
-        "/mcp", {"jsonrpc": "2.0", "method": "tools/call", "id": 2}
-    )
-    assert missing_params_response.status_code == 200
-    assert "error" in missing_params_response.json
+    assert "error" in mcp_call(app, {"jsonrpc": "2.0", "method": "tools/call", "id": 2})
 
     # 4. Call non-existent tool
-    nonexistent_tool_response = integration_app.post_json(
-        "/mcp",
+    nonexistent_tool_response = mcp_call(
+        app,
         {
             "jsonrpc": "2.0",
             "method": "tools/call",
@@ -739,57 +544,29 @@ def test_error_handling_across_components(integration_app):
             "id": 3,
         },
     )
-    assert nonexistent_tool_response.status_code == 200
-    assert "error" in nonexistent_tool_response.json
-    assert "does_not_exist" in nonexistent_tool_response.json["error"]["message"]
+    assert "error" in nonexistent_tool_response
+    assert "does_not_exist" in nonexistent_tool_response["error"]["message"]
 
 
-def test_performance_and_concurrency_simulation(pyramid_app):
+def test_performance_and_concurrency_simulation(real_routes_app, mcp_call):
     """Simulate performance testing with multiple tool calls."""
-    # Use our proven working fixture with route discovery enabled
-    settings = {
-        "mcp.route_discovery.enabled": True,
-        "mcp.server_name": "performance-test",
-        "mcp.server_version": "1.0.0",
-    }
-
-    app = pyramid_app(settings)
-
-    # Test multiple calls via MCP protocol
-    results = []
-    for i in range(5):
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": "performance_test",
-                "arguments": {"body": {"iterations": 50, "operation": "compute"}},
-            },
-            "id": i + 1,
-        }
-
-        response = app.post_json("/mcp", request)
-        assert response.status_code == 200
-
-        # Expect new MCP context format
-        result_data = response.json["result"]
-        assert result_data["type"] == "mcp/context"
-        assert "content" in result_data
-
-        # Extract content from new structure
-        result_content = result_data["content"][0]["text"]
-
-        # Extract result directly from content
-        result = str(result_content)
+    app = real_routes_app
+    hits_before = performance_test.cache_info().hits
+
+    # Send the five calls via MCP protocol as one batch request
+    responses = _call_batch(
+        mcp_call,
+        app,
+        [
+            _tool_call(i + 1, "performance_test", iterations=50, operation="compute")
+            for i in range(5)
+        ],
+    )
 
-        results.append(result)
+    # Expect new MCP context format
+    results = [_context_text(responses[i + 1]) for i in range(5)]
 
-    # All should complete successfully (handle both success and error cases)
-    assert len(results) == 5
-    for result in results:
-        # Check if it completed successfully or handled error gracefully
-        assert (
-            "Completed 50 compute operations" in result
-            or "Tool execution failed" in result
-            or "error" in result.lower()
-        ), f"Expected success or error handling, got: {result}"
+    # All should complete successfully: sum(i * i for i in range(50)) == 40425
+    assert results == ["Completed 50 compute operations, result: 40425"] * 5
+    # performance_test is pure, so repeated identical calls hit its result cache
+    assert performance_test.cache_info().hits >= hits_before + 4
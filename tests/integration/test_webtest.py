@@ -17,28 +17,54 @@ from pyramid.view import view_config
 from webtest import TestApp  # type: ignore
 
 from pyramid_mcp import tool
+from pyramid_mcp.serialization import dumps_bytes
+
+# Keep the WebTest tests on one xdist worker so they share the module's apps
+pytestmark = pytest.mark.xdist_group("mcp_webtest")
+
+# Constant JSON-RPC requests, pre-serialized once for the HTTP-level tests
+INITIALIZE_BODY = dumps_bytes({"jsonrpc": "2.0", "method": "initialize", "id": 1})
+LIST_TOOLS_BODY = dumps_bytes({"jsonrpc": "2.0", "method": "tools/list", "id": 2})
+
+# =============================================================================
+# 🏗️ TEST-SPECIFIC FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def available_tool_names(shared_integration_app):
+    """Module fixture: names of the tools listed by shared_integration_app.
+
+    The tool set only depends on the app configuration, so tools/list is
+    called once for the tests that need a tool to be available.
+    """
+    response = shared_integration_app.post(
+        "/mcp", LIST_TOOLS_BODY, content_type="application/json"
+    )
+    return frozenset(tool["name"] for tool in response.json["result"]["tools"])
+
 
 # =============================================================================
 # 🌐 MCP HTTP ENDPOINT INTEGRATION TESTS
 # =============================================================================
 
 
-def test_mcp_endpoint_exists(integration_app):
+def test_mcp_endpoint_exists(shared_integration_app):
     """Test that the MCP HTTP endpoint is mounted and responds."""
     # Test that the MCP endpoint exists (should accept POST)
-    response = integration_app.post_json(
-        "/mcp", {"jsonrpc": "2.0", "method": "initialize", "id": 1}
+    response = shared_integration_app.post(
+        "/mcp", INITIALIZE_BODY, content_type="application/json"
     )
 
     assert response.status_code == 200
     assert response.content_type == "application/json"
 
 
-def test_mcp_initialize_via_http(integration_app):
+def test_mcp_initialize_via_http(shared_integration_app):
     """Test MCP initialize request via real HTTP using fixture."""
-    request_data = {"jsonrpc": "2.0", "method": "initialize", "id": 1}
-
-    response = integration_app.post_json("/mcp", request_data)
+    response = shared_integration_app.post(
+        "/mcp", INITIALIZE_BODY, content_type="application/json"
+    )
 
     assert response.status_code == 200
     data = response.json
@@ -52,11 +78,11 @@ def test_mcp_initialize_via_http(integration_app):
     assert "capabilities" in data["result"]
 
 
-def test_mcp_list_tools_via_http(integration_app):
+def test_mcp_list_tools_via_http(shared_integration_app):
     """Test MCP tools/list request via real HTTP."""
-    request_data = {"jsonrpc": "2.0", "method": "tools/list", "id": 2}
-
-    response = integration_app.post_json("/mcp", request_data)
+    response = shared_integration_app.post(
+        "/mcp", LIST_TOOLS_BODY, content_type="application/json"
+    )
 
     assert response.status_code == 200
     data = response.json
@@ -75,17 +101,10 @@ def test_mcp_list_tools_via_http(integration_app):
         assert all("description" in tool for tool in tools)
 
 
-def test_mcp_call_tool_calculation(integration_app):
+def test_mcp_call_tool_calculation(shared_integration_app, available_tool_names):
     """Test MCP tools/call request with calculation tool if available."""
-    # First check what tools are available
-    list_request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
-    list_response = integration_app.post_json("/mcp", list_request)
-
-    tools = list_response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
-
     # Skip if calculate tool is not available
-    if "calculate" not in tool_names:
+    if "calculate" not in available_tool_names:
         pytest.skip("No calculate tool available in fixture setup")
 
     # Test the calculate tool deterministically
@@ -99,7 +118,7 @@ def test_mcp_call_tool_calculation(integration_app):
         "id": 3,
     }
 
-    response = integration_app.post_json("/mcp", request_data)
+    response = shared_integration_app.post_json("/mcp", request_data)
 
     assert response.status_code == 200
     data = response.json
@@ -119,7 +138,7 @@ def test_mcp_call_tool_calculation(integration_app):
     assert "15" in result_text  # Calculated result should be present
 
 
-def test_mcp_error_handling_via_http(integration_app):
+def test_mcp_error_handling_via_http(shared_integration_app):
     """Test MCP error handling via real HTTP."""
     # Test calling non-existent tool
     request_data = {
@@ -129,7 +148,7 @@ def test_mcp_error_handling_via_http(integration_app):
         "id": 5,
     }
 
-    response = integration_app.post_json("/mcp", request_data)
+    response = shared_integration_app.post_json("/mcp", request_data)
 
     assert (
         response.status_code == 200
@@ -141,10 +160,10 @@ def test_mcp_error_handling_via_http(integration_app):
     assert "nonexistent_tool" in data["error"]["message"]
 
 
-def test_mcp_invalid_json_request(integration_app):
+def test_mcp_invalid_json_request(shared_integration_app):
     """Test MCP handling of invalid JSON requests."""
     # Send invalid JSON
-    response = integration_app.post(
+    response = shared_integration_app.post(
         "/mcp", "invalid json", content_type="application/json", expect_errors=True
     )
 
@@ -152,16 +171,17 @@ def test_mcp_invalid_json_request(integration_app):
     data = response.json
 
     assert "error" in data
-    # Implementation returns -32603 (Internal Error) for JSON parse errors
-    assert data["error"]["code"] == -32603  # INTERNAL_ERROR
+    assert data["id"] is None
+    assert data["error"]["code"] == -32700  # PARSE_ERROR
+    assert data["error"]["message"] == "Parse error"
 
 
-def test_mcp_malformed_request(integration_app):
+def test_mcp_malformed_request(shared_integration_app):
     """Test MCP handling of malformed requests."""
     # Send valid JSON but not a valid JSON-RPC request
     request_data = {"invalid": "request", "missing": "required_fields"}
 
-    response = integration_app.post_json("/mcp", request_data)
+    response = shared_integration_app.post_json("/mcp", request_data)
 
     assert response.status_code == 200
     data = response.json
@@ -171,17 +191,10 @@ def test_mcp_malformed_request(integration_app):
     assert data["error"]["code"] == -32601  # METHOD_NOT_FOUND
 
 
-def test_mcp_tool_validation_error(integration_app):
+def test_mcp_tool_validation_error(shared_integration_app, available_tool_names):
     """Test MCP tool call that triggers validation error."""
-    # First check for available tools
-    list_request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
-    list_response = integration_app.post_json("/mcp", list_request)
-
-    tools = list_response.json["result"]["tools"]
-    tool_names = [tool["name"] for tool in tools]
-
     # Skip if calculate tool is not available
-    if "calculate" not in tool_names:
+    if "calculate" not in available_tool_names:
         pytest.skip("No calculate tool available for validation testing")
 
     # Test validation error deterministically
@@ -195,7 +208,7 @@ def test_mcp_tool_validation_error(integration_app):
         "id": 6,
     }
 
-    response = integration_app.post_json("/mcp", request_data)
+    response = shared_integration_app.post_json("/mcp", request_data)
 
     assert response.status_code == 200
     data = response.json
@@ -203,9 +216,9 @@ def test_mcp_tool_validation_error(integration_app):
     # Should return an error for invalid operation (in MCP format)
     # MCP wraps errors in result.content structure
     assert "result" in data
-    result_content = str(data["result"]["content"][0]["text"])
-    assert "error" in result_content.lower()
-    assert "unknown operation" in result_content.lower()
+    result_content = str(data["result"]["content"][0]["text"]).lower()
+    assert "error" in result_content
+    assert "unknown operation" in result_content
 
 
 # =============================================================================
@@ -230,20 +243,26 @@ def test_pyramid_endpoints_still_work(integration_app):
     assert "id" in created_user
 
 
-def test_get_user_endpoint(integration_app):
+@pytest.fixture(scope="module")
+def created_user(shared_integration_app, integration_users):
+    """Module fixture: one user created via the API for the read-only tests."""
+    user_data = {"name": "Shared", "email": "shared@example.com"}
+    user = shared_integration_app.post_json("/users", user_data).json["user"]
+    yield user
+    users_db, _ = integration_users
+    users_db.pop(user["id"], None)
+
+
+def test_get_user_endpoint(shared_integration_app, created_user):
     """Test GET user endpoint integration."""
-    # First create a user
-    user_data = {"name": "Bob", "email": "bob@example.com"}
-    create_response = integration_app.post_json("/users", user_data)
-    user_id = create_response.json["user"]["id"]
+    user_id = created_user["id"]
 
-    # Now get the user
-    response = integration_app.get(f"/users/{user_id}")
+    response = shared_integration_app.get(f"/users/{user_id}")
     assert response.status_code == 200
 
     user = response.json["user"]
-    assert user["name"] == "Bob"
-    assert user["email"] == "bob@example.com"
+    assert user["name"] == "Shared"
+    assert user["email"] == "shared@example.com"
     assert user["id"] == user_id
 
 
@@ -361,19 +380,19 @@ def test_server_info_configuration(pyramid_config, mcp_settings_factory):
 # =============================================================================
 
 
-def test_sse_endpoint_exists(integration_app):
+def test_sse_endpoint_exists(shared_integration_app):
     """Test that SSE endpoint exists and is accessible."""
     # Test SSE endpoint exists (GET request)
-    response = integration_app.get("/mcp/sse", expect_errors=True)
+    response = shared_integration_app.get("/mcp/sse", expect_errors=True)
 
     # Should either work (200) or be not implemented (405/501)
     assert response.status_code in [200, 405, 501]
 
 
-def test_sse_endpoint_handles_get(integration_app):
+def test_sse_endpoint_handles_get(shared_integration_app):
     """Test SSE endpoint handles GET requests appropriately."""
     # Test SSE endpoint with GET
-    response = integration_app.get("/mcp/sse", expect_errors=True)
+    response = shared_integration_app.get("/mcp/sse", expect_errors=True)
 
     # Should handle GET request (may return 200 or error depending on implementation)
     assert response.status_code in [200, 405, 501]
@@ -407,6 +426,7 @@ def test_route_discovery_end_to_end():
         "mcp.server_version": "1.0.0",
         "mcp.mount_path": "/mcp",
         "mcp.route_discovery.enabled": True,  # Enable route discovery
+        "mcp.scan": False,  # The tool is registered explicitly below
     }
 
     config = Configurator(settings=settings)
@@ -430,8 +450,8 @@ def test_route_discovery_end_to_end():
     # Include pyramid_mcp after adding routes/views
     config.include("pyramid_mcp")
 
-    # Scan to register module-level @tool decorated functions
-    config.scan(__name__, categories=["pyramid_mcp"])
+    # Register the module-level @tool explicitly instead of scanning for it
+    config.add_mcp_tool(manual_integration_tool)
 
     app = TestApp(config.make_wsgi_app())
 
@@ -6,10 +6,14 @@ This module tests:
 - MCPConfiguration class functionality
 - PyramidMCP class creation and basic functionality
 - Core module integration
+- The standalone MCP WSGI app
 
 Uses enhanced fixtures from conftest.py for clean, non-duplicated test setup.
 """
 
+import pytest
+from webtest import TestApp
+
 from pyramid_mcp import PyramidMCP, __version__, tool
 from pyramid_mcp.core import MCPConfiguration
 from pyramid_mcp.introspection import PyramidIntrospector
@@ -39,6 +43,27 @@ def unit_calculate(operation: str, a: float, b: float) -> float:
         raise ValueError(f"Unknown operation: {operation}")
 
 
+# =============================================================================
+# 🏗️ FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def unit_wsgi_app(pyramid_config):
+    """Committed WSGI app with route discovery enabled, built once per module.
+
+    make_wsgi_app() commits every pending action and scans the tests package,
+    so tests that only inspect the resulting registry share this instance.
+    """
+    settings = {
+        "mcp.route_discovery.enabled": True,
+        "mcp.server_name": "unit-test-server",
+        "mcp.server_version": "1.0.0",
+        "mcp.mount_path": "/mcp",
+    }
+    return pyramid_config(settings=settings, commit=True).make_wsgi_app()
+
+
 # =============================================================================
 # 📦 PACKAGE IMPORTS AND AVAILABILITY TESTS
 # =============================================================================
@@ -58,17 +83,23 @@ def test_pyramid_mcp_version():
     assert len(__version__) > 0
 
 
-def test_main_classes_available():
+@pytest.mark.parametrize(
+    "obj",
+    [
+        PyramidMCP,
+        MCPConfiguration,
+        PyramidIntrospector,
+        MCPProtocolHandler,
+        MCPTool,
+        MCPErrorCode,
+        MCPErrorSchema,
+        MCPWSGIApp,
+    ],
+    ids=lambda obj: obj.__name__,
+)
+def test_main_classes_available(obj):
     """Test that main classes are available for import."""
-    # These imports should work without errors
-    assert PyramidMCP is not None
-    assert MCPConfiguration is not None
-    assert PyramidIntrospector is not None
-    assert MCPProtocolHandler is not None
-    assert MCPTool is not None
-    assert MCPErrorCode is not None
-    assert MCPErrorSchema is not None
-    assert MCPWSGIApp is not None
+    assert obj is not None
 
 
 # =============================================================================
@@ -139,21 +170,10 @@ def test_pyramid_mcp_creation_configured(custom_mcp_config):
     assert pyramid_mcp.config.server_name == "test-server"  # From custom_mcp_config
 
 
-def test_pyramid_mcp_manual_tool_registration(pyramid_app):
+def test_pyramid_mcp_manual_tool_registration(unit_wsgi_app):
     """Test registering tools manually with PyramidMCP."""
-    # Use our proven working fixture with route discovery enabled
-    settings = {
-        "mcp.route_discovery.enabled": True,
-        "mcp.server_name": "unit-test-server",
-        "mcp.server_version": "1.0.0",
-        "mcp.mount_path": "/mcp",
-    }
-
-    # Create TestApp using the global fixture (which handles scanning automatically)
-    testapp = pyramid_app(settings)
-
-    # Get the pyramid_mcp instance from the TestApp's app registry
-    pyramid_mcp = testapp.app.registry.pyramid_mcp
+    # Get the pyramid_mcp instance from the WSGI app registry
+    pyramid_mcp = unit_wsgi_app.registry.pyramid_mcp
 
     # Check that the module-level tool is registered
     assert "unit_calculate" in pyramid_mcp.protocol_handler.tools
@@ -232,3 +252,34 @@ def test_introspector_has_discovery_methods(pyramid_config):
     assert hasattr(introspector, "discover_tools")
     assert callable(introspector.discover_routes)
     assert callable(introspector.discover_tools)
+
+
+# =============================================================================
+# 🌐 STANDALONE MCP WSGI APP TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def mcp_wsgi_app():
+    """Standalone MCP WSGI app around a bare protocol handler."""
+    handler = MCPProtocolHandler("test-server", "1.0.0")
+    return TestApp(MCPWSGIApp(handler, MCPConfiguration()))
+
+
+def test_wsgi_app_acknowledges_notification_only_batch(mcp_wsgi_app):
+    """Test that a batch of only notifications gets the notification ack."""
+    batch = [{"jsonrpc": "2.0", "method": "notifications/initialized"}]
+
+    response = mcp_wsgi_app.post_json("/", batch, status=200)
+
+    assert response.json == {"jsonrpc": "2.0", "result": "ok"}
+
+
+def test_wsgi_app_answers_invalid_json_with_parse_error(mcp_wsgi_app):
+    """Test that a body that is not JSON gets a JSON-RPC parse error."""
+    response = mcp_wsgi_app.post(
+        "/", "invalid json", content_type="application/json", status=200
+    )
+
+    assert response.json["id"] is None
+    assert response.json["error"]["code"] == MCPErrorCode.PARSE_ERROR
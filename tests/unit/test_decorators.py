@@ -0,0 +1,73 @@
+"""
+Unit tests for the pyramid_mcp @tool decorator.
+
+This module tests:
+- Result memoization of pure tools (cache_info/cache_clear)
+- Unhashable arguments bypassing the memoization cache
+- Tools that are not pure calling through on every invocation
+"""
+
+from pyramid_mcp import tool
+
+# =============================================================================
+# 🧪 PURE TOOL TESTS
+# =============================================================================
+
+
+def _counting_tool(**tool_kwargs):
+    """Create a @tool function recording every call that reaches its body."""
+    calls = []
+
+    @tool(**tool_kwargs)
+    def count(value):
+        calls.append(value)
+        return f"value: {value}"
+
+    return count, calls
+
+
+def test_pure_tool_memoizes_results():
+    """Test that a pure tool runs once per distinct argument."""
+    count, calls = _counting_tool(name="count", pure=True)
+    memoized = count.__mcp_tool_settings__["_memoized"]
+
+    assert memoized(value=1) == "value: 1"
+    assert memoized(value=1) == "value: 1"
+    assert memoized(value=2) == "value: 2"
+
+    assert calls == [1, 2]
+    info = count.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_pure_tool_cache_clear():
+    """Test that cache_clear() empties the result cache of a pure tool."""
+    count, calls = _counting_tool(name="count", pure=True)
+    memoized = count.__mcp_tool_settings__["_memoized"]
+    memoized(value=1)
+
+    count.cache_clear()
+    memoized(value=1)
+
+    assert calls == [1, 1]
+    assert count.cache_info().currsize == 1
+
+
+def test_pure_tool_unhashable_arguments_bypass_cache():
+    """Test that unhashable arguments are passed through uncached."""
+    count, calls = _counting_tool(name="count", pure=True)
+    memoized = count.__mcp_tool_settings__["_memoized"]
+
+    assert memoized(value=[1, 2]) == "value: [1, 2]"
+    assert memoized(value=[1, 2]) == "value: [1, 2]"
+
+    assert calls == [[1, 2], [1, 2]]
+    assert count.cache_info().currsize == 0
+
+
+def test_tool_without_pure_is_not_memoized():
+    """Test that tools are only memoized when declared pure."""
+    count, _ = _counting_tool(name="count")
+
+    assert "_memoized" not in count.__mcp_tool_settings__
+    assert not hasattr(count, "cache_info")
@@ -17,7 +17,11 @@ from pyramid.response import Response
 
 from pyramid_mcp.core import MCPConfiguration
 from pyramid_mcp.introspection import PyramidIntrospector
-from pyramid_mcp.introspection.filters import pattern_matches_route
+from pyramid_mcp.introspection.filters import (
+    _wildcard_regex,
+    pattern_matches_route,
+    tool_pattern_matches,
+)
 
 # =============================================================================
 # 🔍 ROUTE DISCOVERY TESTS
@@ -363,6 +367,19 @@ def test_pattern_matching_advanced(pyramid_config):
         assert result == expected, f"Pattern matching failed for {path}"
 
 
+def test_wildcard_patterns_compiled_once():
+    """Test that a wildcard pattern is compiled once for all its matches."""
+    _wildcard_regex.cache_clear()
+
+    assert pattern_matches_route("api/*", "/api/users", "test_route")
+    assert not pattern_matches_route("api/*", "/admin/users", "test_route")
+    assert tool_pattern_matches("api*", "api_users")
+    assert not tool_pattern_matches("api*", "admin_users")
+
+    # One compilation per distinct pattern, however many routes and tools
+    assert _wildcard_regex.cache_info().misses == 2
+
+
 def test_route_exclusion():
     """Test route exclusion logic."""
     config = Configurator()
@@ -9,7 +9,10 @@ This module tests:
 - Tool name validation and sanitization for Claude Desktop compatibility
 """
 
+import threading
+
 from pyramid_mcp import tool
+from pyramid_mcp.core import MCPConfiguration
 from pyramid_mcp.protocol import (
     CLAUDE_TOOL_NAME_PATTERN,
     MCPErrorCode,
@@ -18,6 +21,7 @@ from pyramid_mcp.protocol import (
     sanitize_tool_name,
     validate_tool_name,
 )
+from pyramid_mcp.schemas import MCPResponseSchema
 
 # =============================================================================
 # 🛠️ MODULE-LEVEL TOOL DEFINITIONS (for Venusian scanning)
@@ -163,6 +167,22 @@ def test_list_tools_request_empty(protocol_handler, test_pyramid_request):
     assert response["result"]["tools"] == []
 
 
+def test_list_resources_and_prompts_requests(protocol_handler, test_pyramid_request):
+    """Test that resources/list and prompts/list dispatch to empty listings."""
+    handler = protocol_handler
+
+    for request_id, method, key in [
+        (3, "resources/list", "resources"),
+        (4, "prompts/list", "prompts"),
+    ]:
+        request_data = {"jsonrpc": "2.0", "id": request_id, "method": method}
+
+        response = handler.handle_message(request_data, test_pyramid_request)
+
+        assert response["id"] == request_id
+        assert response["result"] == {key: []}
+
+
 def test_list_tools_request_with_tool(protocol_handler, test_pyramid_request):
     """Test listing tools when tools are registered."""
     handler = protocol_handler
@@ -186,6 +206,165 @@ def test_list_tools_request_with_tool(protocol_handler, test_pyramid_request):
     assert tools[0]["description"] == "Test tool"
 
 
+def test_list_tools_reflects_later_registrations(
+    protocol_handler, test_pyramid_request
+):
+    """Test that registering a tool invalidates the cached tool descriptors."""
+    handler = protocol_handler
+    request_data = {"jsonrpc": "2.0", "id": 3, "method": "tools/list", "params": {}}
+
+    handler.register_tool(MCPTool(name="first_tool", description="First"))
+    response = handler.handle_message(request_data, test_pyramid_request)
+    assert [t["name"] for t in response["result"]["tools"]] == ["first_tool"]
+
+    handler.register_tool(MCPTool(name="second_tool", description="Second"))
+    response = handler.handle_message(request_data, test_pyramid_request)
+    assert [t["name"] for t in response["result"]["tools"]] == [
+        "first_tool",
+        "second_tool",
+    ]
+
+
+def test_list_tools_reuses_cached_payload(protocol_handler, test_pyramid_request):
+    """Test that unfiltered tools/list responses share one cached tools list."""
+    handler = protocol_handler
+    request_data = {"jsonrpc": "2.0", "id": 3, "method": "tools/list", "params": {}}
+    handler.register_tool(MCPTool(name="cached_tool", description="Cached"))
+
+    first = handler.handle_message(request_data, test_pyramid_request)
+    second = handler.handle_message(request_data, test_pyramid_request)
+
+    assert first["result"]["tools"] is second["result"]["tools"]
+
+
+def test_find_tools_by_keyword(protocol_handler):
+    """Test keyword lookup over registered tool names and descriptions."""
+    handler = protocol_handler
+    handler.register_tool(MCPTool(name="list_users", description="List all users"))
+    handler.register_tool(MCPTool(name="get_user", description="Get one user"))
+    handler.register_tool(MCPTool(name="hello_world", description="Say hello"))
+
+    assert handler.find_tools("hello") == ["hello_world"]
+    assert handler.find_tools("USER") == ["get_user"]
+    # Tools matching more keywords rank first
+    assert handler.find_tools("list users") == ["list_users"]
+    assert handler.find_tools("get list") == ["get_user", "list_users"]
+    assert handler.find_tools("missing") == []
+
+
+def test_success_response_matches_response_schema(protocol_handler):
+    """Test that success envelopes match what MCPResponseSchema produces."""
+    for request_id, result in [(1, {"tools": []}), ("abc", None), (None, {})]:
+        expected = MCPResponseSchema().dump({"id": request_id, "result": result})
+        assert protocol_handler._success_response(request_id, result) == expected
+
+
+def test_handle_batch_request(protocol_handler, test_pyramid_request):
+    """Test that a JSON-RPC batch returns one response per non-notification."""
+    handler = protocol_handler
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 2, "method": "unknown/method", "params": {}},
+    ]
+
+    responses = handler.handle_batch(batch, test_pyramid_request)
+
+    assert [response["id"] for response in responses] == [1, 2]
+    assert "result" in responses[0]
+    assert responses[1]["error"]["code"] == MCPErrorCode.METHOD_NOT_FOUND
+
+
+def test_handle_batch_of_notifications_and_empty_batch(
+    protocol_handler, test_pyramid_request
+):
+    """Test batches without responses and the empty batch error."""
+    handler = protocol_handler
+    notifications = [{"jsonrpc": "2.0", "method": "notifications/initialized"}]
+
+    assert (
+        handler.handle_batch(notifications, test_pyramid_request) is handler.NO_RESPONSE
+    )
+
+    response = handler.handle_batch([], test_pyramid_request)
+    assert response["id"] is None
+    assert response["error"]["code"] == MCPErrorCode.INVALID_REQUEST
+
+
+def test_handle_batch_concurrently_keeps_message_order(test_pyramid_request):
+    """Test that batch messages run on worker threads with ordered responses."""
+    config = MCPConfiguration(batch_max_workers=4)
+    handler = MCPProtocolHandler("test-protocol", "1.0.0", config=config)
+    threads = set()
+
+    def record_thread(mcp_request, request):
+        threads.add(threading.current_thread().name)
+        return handler._success_response(mcp_request["id"], None)
+
+    handler._method_handlers["test/thread"] = record_thread
+    batch = [{"jsonrpc": "2.0", "id": i, "method": "test/thread"} for i in range(1, 9)]
+    batch.append({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    responses = handler.handle_batch(batch, test_pyramid_request)
+
+    assert [response["id"] for response in responses] == list(range(1, 9))
+    assert threads
+    assert all(name.startswith("pyramid-mcp-batch") for name in threads)
+
+
+def test_batch_workers_do_not_share_transaction_manager():
+    """Test that subrequests built on batch threads get no parent request.tm."""
+    from pyramid import testing
+    from pyramid.request import Request
+
+    config = testing.setUp()
+    config.add_route("items", "/items")
+    config.commit()
+    handler = MCPProtocolHandler(
+        "test-protocol", "1.0.0", config=MCPConfiguration(batch_max_workers=2)
+    )
+    request = testing.DummyRequest(environ={"tm.active": True})
+    request.registry = config.registry
+    request.tm = object()
+
+    def copy_context():
+        subrequest = Request.blank("/items")
+        handler._copy_request_context(request, subrequest)
+        return subrequest
+
+    try:
+        on_request_thread = copy_context()
+        on_batch_thread = handler._batch_executor.submit(copy_context).result()
+    finally:
+        handler.close()
+        testing.tearDown()
+
+    assert on_request_thread.tm is request.tm
+    assert on_request_thread.environ["tm.active"] is True
+    assert "tm" not in on_batch_thread.__dict__
+    assert "tm.active" not in on_batch_thread.environ
+
+
+def test_close_shuts_down_batch_executor(test_pyramid_request):
+    """Test that close() stops the pool and later batches run sequentially."""
+    handler = MCPProtocolHandler(
+        "test-protocol", "1.0.0", config=MCPConfiguration(batch_max_workers=2)
+    )
+    executor = handler._batch_executor
+
+    handler.close()
+    handler.close()
+
+    assert handler._batch_executor is None
+    assert executor._shutdown
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+    ]
+    responses = handler.handle_batch(batch, test_pyramid_request)
+    assert [response["id"] for response in responses] == [1, 2]
+
+
 def test_call_tool_request(pyramid_app):
     """Test calling a tool through MCP protocol using proper @tool decorator."""
     # Create app with the tool properly registered via scanning
@@ -254,7 +433,7 @@ def test_unknown_method_error(protocol_handler, test_pyramid_request):
     assert response["jsonrpc"] == "2.0"
     assert response["id"] == 6
     assert "error" in response
-    assert response["error"]["code"] == MCPErrorCode.METHOD_NOT_FOUND.value
+    assert response["error"]["code"] == MCPErrorCode.METHOD_NOT_FOUND
 
 
 def test_tool_not_found_error(protocol_handler, test_pyramid_request):
@@ -273,7 +452,7 @@ def test_tool_not_found_error(protocol_handler, test_pyramid_request):
     assert response["jsonrpc"] == "2.0"
     assert response["id"] == 7
     assert "error" in response
-    assert response["error"]["code"] == MCPErrorCode.METHOD_NOT_FOUND.value
+    assert response["error"]["code"] == MCPErrorCode.METHOD_NOT_FOUND
 
 
 def test_malformed_request_error(protocol_handler, test_pyramid_request):
@@ -678,13 +857,9 @@ def test_register_tool_preserves_functionality():
     handler.register_tool(tool)
 
     # Find the sanitized name
-    sanitized_name = None
-    for name in handler.tools:
-        if "add" in name and "two" in name:
-            sanitized_name = name
-            break
-
-    assert sanitized_name is not None
+    matches = handler.find_tools("add two")
+    assert matches
+    sanitized_name = matches[0]
     registered_tool = handler.tools[sanitized_name]
 
     # Functionality should be preserved
@@ -10,11 +10,61 @@ This module tests:
 No tool definitions to avoid configuration conflicts.
 """
 
-from pyramid_mcp import PyramidMCP
+import pytest
+from pyramid.config import Configurator
+
+from pyramid_mcp import PyramidMCP, includeme
 from pyramid_mcp.core import MCPConfiguration
 from pyramid_mcp.introspection import PyramidIntrospector
 from pyramid_mcp.introspection.security import convert_security_type_to_schema
 
+# Spellings accepted for each security type and the schema they resolve to
+BEARER_CASES = [
+    ("bearer", "BearerAuthSchema"),
+    ("Bearer", "BearerAuthSchema"),
+    ("BEARER", "BearerAuthSchema"),
+    ("BearerAuth", "BearerAuthSchema"),
+    ("bearerauth", "BearerAuthSchema"),
+    ("bearer_auth", "BearerAuthSchema"),
+    ("Bearer-Auth", "BearerAuthSchema"),
+    ("jwt", "BearerAuthSchema"),
+]
+BASIC_CASES = [
+    ("basic", "BasicAuthSchema"),
+    ("Basic", "BasicAuthSchema"),
+    ("BASIC", "BasicAuthSchema"),
+    ("BasicAuth", "BasicAuthSchema"),
+    ("basicauth", "BasicAuthSchema"),
+    ("basic_auth", "BasicAuthSchema"),
+    ("basic-auth", "BasicAuthSchema"),
+]
+
+# =============================================================================
+# 🏗️ FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def configured_mcp_factory():
+    """Factory returning an included (config, pyramid_mcp) pair per settings.
+
+    Pairs are memoized on the settings so includeme runs once per distinct
+    settings dict in this module. The returned objects are shared between
+    tests and must be treated as read-only.
+    """
+    cache = {}
+
+    def _create(settings):
+        key = tuple(sorted(settings.items()))
+        if key not in cache:
+            config = Configurator(settings=settings)
+            includeme(config)
+            cache[key] = (config, config.registry.pyramid_mcp)  # type: ignore
+        return cache[key]
+
+    return _create
+
+
 # =============================================================================
 # 🔐 CONFIGURABLE SECURITY PARAMETER TESTS
 # =============================================================================
@@ -58,48 +108,31 @@ def test_extract_config_from_settings_custom():
     assert config.security_parameter == "pcm_security"
 
 
-def test_introspector_uses_configurable_parameter(pyramid_config):
+def test_introspector_uses_configurable_parameter(minimal_pyramid_config):
     """Test that introspector uses configurable security parameter."""
-
-    def test_view(request):
-        return {"test": "data"}
-
-    views = [(test_view, "test_route", {"renderer": "json"})]
-    config = pyramid_config(views=views, commit=True)
-
     # Create a real MCP configuration with custom security parameter
     mcp_config = MCPConfiguration(
         security_parameter="pcm_security", route_discovery_enabled=True
     )
-    pyramid_mcp = PyramidMCP(config, config=mcp_config)
+    pyramid_mcp = PyramidMCP(minimal_pyramid_config, config=mcp_config)
 
-    # Discover tools - this will set the security parameter in the introspector
-    pyramid_mcp.discover_tools()
+    # Apply the discovery configuration without walking the app's routes
+    pyramid_mcp.introspector.configure(pyramid_mcp._get_discovery_config())
 
     # Check that the introspector gets the security parameter correctly
     assert pyramid_mcp.introspector._security_parameter == "pcm_security"
 
 
-def test_convert_security_type_bearer_variations(pyramid_config):
-    """Test conversion of various bearer auth security types."""
-    # Test different bearer auth variations
-    variations = ["bearer", "BearerAuth", "Bearer", "BEARER", "bearer_auth", "jwt"]
-
-    for variation in variations:
-        result = convert_security_type_to_schema(variation)
-        assert result is not None
-        assert result.__class__.__name__ == "BearerAuthSchema"
-
-
-def test_convert_security_type_basic_variations(pyramid_config):
-    """Test conversion of various basic auth security types."""
-    # Test different basic auth variations
-    variations = ["basic", "BasicAuth", "Basic", "BASIC", "basic_auth"]
-
-    for variation in variations:
-        result = convert_security_type_to_schema(variation)
-        assert result is not None
-        assert result.__class__.__name__ == "BasicAuthSchema"
+@pytest.mark.parametrize(
+    "security_type, expected_schema",
+    BEARER_CASES + BASIC_CASES,
+    ids=[case[0] for case in BEARER_CASES + BASIC_CASES],
+)
+def test_convert_security_type_variations(security_type, expected_schema):
+    """Test that security type matching ignores case and hyphen/underscore."""
+    result = convert_security_type_to_schema(security_type)
+    assert result is not None
+    assert result.__class__.__name__ == expected_schema
 
 
 def test_convert_security_type_unknown(pyramid_config):
@@ -108,6 +141,15 @@ def test_convert_security_type_unknown(pyramid_config):
     assert result is None
 
 
+def test_convert_security_type_returns_fresh_instances():
+    """Test that cached lookups still return a new schema instance per call."""
+    first = convert_security_type_to_schema("bearer")
+    second = convert_security_type_to_schema("bearer")
+
+    assert first is not second
+    assert type(first) is type(second)
+
+
 def test_end_to_end_with_custom_security_parameter(pyramid_config):
     """Test end-to-end functionality with custom security parameter."""
 
@@ -172,25 +214,16 @@ def test_multiple_views_with_different_security_parameters(pyramid_config):
     assert auth_schema.__class__.__name__ == "BearerAuthSchema"
 
 
-def test_plugin_includeme_with_custom_security_parameter():
+def test_plugin_includeme_with_custom_security_parameter(configured_mcp_factory):
     """Test that includeme works with custom security parameter setting."""
-    from pyramid.config import Configurator
-
-    from pyramid_mcp import includeme
-
-    # Create configurator with custom security parameter
-    config = Configurator(
-        settings={
+    _, pyramid_mcp = configured_mcp_factory(
+        {
             "mcp.security_parameter": "api_auth",
             "mcp.server_name": "test-server",
         }
     )
 
-    # Include pyramid-mcp
-    includeme(config)
-
     # Check that the PyramidMCP instance was created with correct config
-    pyramid_mcp = config.registry.pyramid_mcp  # type: ignore
     assert pyramid_mcp.config.security_parameter == "api_auth"
     assert pyramid_mcp.config.server_name == "test-server"
 
@@ -209,26 +242,6 @@ def test_none_security_parameter():
     assert config.security_parameter == "mcp_security"
 
 
-def test_case_sensitivity_in_security_types(pyramid_config):
-    """Test that security type matching is case-insensitive."""
-    # Test various case combinations
-    test_cases = [
-        ("bearer", "BearerAuthSchema"),
-        ("BEARER", "BearerAuthSchema"),
-        ("BearerAuth", "BearerAuthSchema"),
-        ("bearerauth", "BearerAuthSchema"),
-        ("basic", "BasicAuthSchema"),
-        ("BASIC", "BasicAuthSchema"),
-        ("BasicAuth", "BasicAuthSchema"),
-        ("basicauth", "BasicAuthSchema"),
-    ]
-
-    for input_type, expected_schema in test_cases:
-        result = convert_security_type_to_schema(input_type)
-        assert result is not None
-        assert result.__class__.__name__ == expected_schema
-
-
 def test_special_characters_in_security_parameter():
     """Test security parameter with special characters."""
     # This should work as long as it's a valid Python identifier
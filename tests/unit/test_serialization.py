@@ -0,0 +1,104 @@
+"""
+Unit tests for pyramid_mcp JSON serialization helpers.
+
+This module tests:
+- Round-tripping MCP payloads through dumps/loads
+- The same results with and without orjson installed
+- The documented differences of the orjson backend
+- The bytes-emitting MCP JSON renderer
+"""
+
+import json
+
+import pytest
+from pyramid import testing
+
+from pyramid_mcp import serialization
+
+PAYLOAD = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "result": {"tools": [{"name": "echo", "inputSchema": {"type": "object"}}]},
+}
+
+# =============================================================================
+# 🏗️ FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test against both the orjson and the stdlib json backends."""
+    if request.param and not serialization.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(serialization, "HAS_ORJSON", request.param)
+    return request.param
+
+
+# =============================================================================
+# 🧪 SERIALIZATION TESTS
+# =============================================================================
+
+
+def test_round_trip(json_backend):
+    """Test that payloads survive a dumps/loads round trip."""
+    assert serialization.loads(serialization.dumps(PAYLOAD)) == PAYLOAD
+    assert serialization.loads(serialization.dumps_bytes(PAYLOAD)) == PAYLOAD
+
+
+def test_dumps_bytes_is_utf8(json_backend):
+    """Test that dumps_bytes returns UTF-8 encoded JSON."""
+    data = serialization.dumps_bytes({"message": "héllo"})
+    assert isinstance(data, bytes)
+    assert json.loads(data.decode("utf-8")) == {"message": "héllo"}
+
+
+def test_dumps_uses_default(json_backend):
+    """Test that dumps falls back to default for unserializable objects."""
+
+    class Custom:
+        pass
+
+    result = serialization.dumps({"value": Custom()}, default=lambda obj: "custom")
+    assert json.loads(result) == {"value": "custom"}
+
+    with pytest.raises(TypeError):
+        serialization.dumps({"value": Custom()})
+
+
+def test_dumps_integers_beyond_64_bits(json_backend):
+    """Test that integers orjson cannot encode are encoded by the stdlib."""
+    big = {"value": 2**70}
+    assert json.loads(serialization.dumps(big)) == big
+    assert json.loads(serialization.dumps_bytes(big)) == big
+
+
+def test_orjson_differences(json_backend):
+    """Test the documented orjson differences for big integers and NaN."""
+    big_document = str(2**70)
+    if json_backend:
+        assert serialization.loads(big_document) == float(2**70)
+        assert serialization.dumps({"value": float("nan")}) == '{"value":null}'
+        with pytest.raises(ValueError):
+            serialization.loads("NaN")
+    else:
+        assert serialization.loads(big_document) == 2**70
+        assert serialization.dumps({"value": float("nan")}) == '{"value": NaN}'
+
+
+def test_loads_invalid_json_raises_value_error(json_backend):
+    """Test that invalid documents raise ValueError on both backends."""
+    with pytest.raises(ValueError):
+        serialization.loads(b"invalid json")
+
+
+def test_mcp_json_renderer_returns_bytes(json_backend):
+    """Test that the MCP renderer returns bytes and sets the JSON content type."""
+    request = testing.DummyRequest()
+    render = serialization.MCPJSONRenderer()(None)
+
+    body = render(PAYLOAD, {"request": request})
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == PAYLOAD
+    assert request.response.content_type == "application/json"